@@ -48,11 +48,11 @@ def compare_generators(prompts: List[str], use_ollama_dsl: bool = True):
         
         for i, prompt in enumerate(test_prompts):
             print(f"  Generating prompt {i+1}...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = dsl_generator.generate_maps([prompt])
-                generation_time = time.time() - start_time
+                generation_time = time.perf_counter() - start_time
                 
                 if result['results'] and result['results'][0].status == "success":
                     dsl_results.append("✅")
@@ -85,11 +85,11 @@ def compare_generators(prompts: List[str], use_ollama_dsl: bool = True):
         
         for i, prompt in enumerate(test_prompts):
             print(f"  Generating prompt {i+1}...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = tool_generator.generate_maps([prompt])
-                generation_time = time.time() - start_time
+                generation_time = time.perf_counter() - start_time
                 
                 if result['results'] and result['results'][0].status == "success":
                     tool_results.append("✅")
@@ -3,6 +3,8 @@
 Simple runner script for the roguelike testing system.
 Activates virtual environment and runs commands.
 """
+import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
@@ -15,8 +17,9 @@ def run_command(cmd):
         print("Virtual environment not found. Run: uv venv && uv pip install ...")
         return 1
     
-    full_cmd = f"PYTHONPATH=. {venv_python} -m src.cli.main {cmd}"
-    return subprocess.call(full_cmd, shell=True)
+    argv = [str(venv_python), "-m", "src.cli.main", *shlex.split(cmd)]
+    env = dict(os.environ, PYTHONPATH=".")
+    return subprocess.call(argv, env=env)
 
 
 if __name__ == "__main__":
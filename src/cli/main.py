@@ -1,21 +1,42 @@
 import json
+import os
 import click
+from dataclasses import asdict
 from pathlib import Path
 from typing import List
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+try:
+    # Optional faster JSON decoder for results and map files
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 """CLI entrypoint with lazy imports for optional providers."""
 from ..generator.smart_positioning_generator import SmartPositioningGenerator
 from ..verifier.map_verifier import MapVerifier
-from ..shared.models import MapData
+from ..shared.models import MapData, VerificationResult
 from ..shared.utils import visualize_map, load_config
-from .report import report
+from .report import report, prerender
 
 
 console = Console()
 
+# Verdicts cached per verify output directory; the most recently used
+# VERIFY_CACHE_SIZE entries are kept
+VERIFY_CACHE_SIZE = 512
+
+
+def _write_summary(output_path: Path, summary: dict):
+    """Write the aggregate block next to the full results as summary.json.
+
+    Lets callers that only print totals skip parsing the per-map results.
+    """
+    with open(output_path / "summary.json", 'w') as f:
+        json.dump({"summary": summary}, f, indent=2, default=str)
+
 
 @click.group()
 def main():
@@ -37,7 +58,8 @@ def main():
 @click.option("--use-claude-dsl", is_flag=True, help="Use DSL-based generator with Claude (Anthropic)")
 @click.option("--use-gemini-dsl", is_flag=True, help="Use DSL-based generator with Gemini (Google)")
 @click.option("--ollama-endpoint", type=str, help="Override Ollama endpoint, e.g., http://host.docker.internal:11434")
-def generate(prompts, prompt, output, example, visualize, verbose, use_ollama_tools, use_tools, use_smart_positioning, use_dsl, use_claude_dsl, use_gemini_dsl, ollama_endpoint):
+@click.option("--shard", type=str, help="Only generate shard I of N (I/N, zero-based); writes generation_results.shardI.json")
+def generate(prompts, prompt, output, example, visualize, verbose, use_ollama_tools, use_tools, use_smart_positioning, use_dsl, use_claude_dsl, use_gemini_dsl, ollama_endpoint, shard):
     """Generate roguelike maps from text prompts."""
     
     # Determine prompts to use
@@ -63,9 +85,21 @@ def generate(prompts, prompt, output, example, visualize, verbose, use_ollama_to
         console.print("[red]Error: Must specify --prompts, --prompt, or --example[/red]")
         return
     
+    # Keep every Nth prompt; indices stay global so shard outputs can be merged
+    prompt_indices = list(range(len(prompts_list)))
+    if shard:
+        try:
+            shard_index, shard_count = (int(part) for part in shard.split("/"))
+        except ValueError:
+            raise click.BadParameter("expected I/N, e.g. 0/4", param_hint="--shard")
+        if not 0 <= shard_index < shard_count:
+            raise click.BadParameter("shard index must be in [0, N)", param_hint="--shard")
+        prompt_indices = prompt_indices[shard_index::shard_count]
+    all_prompts = prompts_list
+    prompts_list = [all_prompts[i] for i in prompt_indices]
+    
     # Optional endpoint override for Ollama
     if ollama_endpoint:
-        import os
         os.environ["OLLAMA_ENDPOINT"] = ollama_endpoint
 
     # Determine generator type (lazy import to avoid optional deps unless needed)
@@ -136,12 +170,19 @@ def generate(prompts, prompt, output, example, visualize, verbose, use_ollama_to
         results = generator.generate_maps(prompts_list)
         progress.update(task, completed=True)
     
+    if shard:
+        # Generators number prompts from 0; map back to suite-wide indices
+        for result in results["results"]:
+            result.prompt_index = prompt_indices[result.prompt_index]
+            if result.map_data:
+                result.map_data.id = f"map_{result.prompt_index:03d}"
+    
     # Create output directory
     output_path = Path(output)
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Save results
-    results_file = output_path / "generation_results.json"
+    results_file = output_path / (f"generation_results.shard{shard_index}.json" if shard else "generation_results.json")
     
     # Convert results to JSON-serializable format
     json_results = {
@@ -167,7 +208,7 @@ def generate(prompts, prompt, output, example, visualize, verbose, use_ollama_to
             
             # Visualize if requested
             if visualize:
-                console.print(f"\n[bold]Map {result.prompt_index}: {prompts_list[result.prompt_index]}[/bold]")
+                console.print(f"\n[bold]Map {result.prompt_index}: {all_prompts[result.prompt_index]}[/bold]")
                 console.print(visualize_map(result.map_data))
         
         json_results["results"].append(result_dict)
@@ -175,6 +216,8 @@ def generate(prompts, prompt, output, example, visualize, verbose, use_ollama_to
     # Save summary results
     with open(results_file, 'w') as f:
         json.dump(json_results, f, indent=2)
+    if not shard:
+        _write_summary(output_path, json_results["summary"])
     
     # Display summary
     summary = results["summary"]
@@ -202,7 +245,10 @@ def generate(prompts, prompt, output, example, visualize, verbose, use_ollama_to
 @click.option("--example", is_flag=True, help="Verify example maps (must run generate --example first)")
 @click.option("--ollama-endpoint", type=str, help="Override Ollama endpoint for verifier LLM")
 @click.option("--verifier-provider", type=click.Choice(["ollama", "anthropic", "gemini"]), help="Override LLM provider for verifier.")
-def verify(maps, prompts, results, output, example, ollama_endpoint, verifier_provider):
+@click.option("--batch", is_flag=True, help="Send all LLM verdicts as one provider batch request (Anthropic Message Batches; other providers verify as usual)")
+@click.option("--no-cache", is_flag=True, help="Re-verify every map instead of reusing cached results for unchanged maps")
+@click.option("--workers", type=click.IntRange(min=1), help="Maps verified concurrently (default: the provider's max_concurrency in verifier.json; 1 for Ollama, else llm.max_concurrency). Start Ollama with OLLAMA_NUM_PARALLEL of at least this value")
+def verify(maps, prompts, results, output, example, ollama_endpoint, verifier_provider, batch, no_cache, workers):
     """Verify that generated maps match their prompts."""
     
     test_cases = []
@@ -214,13 +260,11 @@ def verify(maps, prompts, results, output, example, ollama_endpoint, verifier_pr
             console.print("[red]Error: No generation results found. Run 'generate --example' first.[/red]")
             return
         
-        with open(results_file, 'r') as f:
-            gen_results = json.load(f)
+        gen_results = _json_loads(results_file.read_bytes())
         
         for result in gen_results["results"]:
             if result["status"] == "success" and "map_file" in result:
-                with open(result["map_file"], 'r') as f:
-                    map_data = json.load(f)
+                map_data = _json_loads(Path(result["map_file"]).read_bytes())
                 
                 test_cases.append({
                     "test_id": f"test_{result['prompt_index']:03d}",
@@ -236,8 +280,7 @@ def verify(maps, prompts, results, output, example, ollama_endpoint, verifier_pr
         for i, prompt in enumerate(prompts_list):
             map_file = maps_path / f"map_{i:03d}.json"
             if map_file.exists():
-                with open(map_file, 'r') as f:
-                    map_data = json.load(f)
+                map_data = _json_loads(map_file.read_bytes())
                 
                 test_cases.append({
                     "test_id": f"test_{i:03d}",
@@ -251,13 +294,32 @@ def verify(maps, prompts, results, output, example, ollama_endpoint, verifier_pr
     
     # Optional endpoint override for verifier
     if ollama_endpoint:
-        import os
         os.environ["OLLAMA_ENDPOINT"] = ollama_endpoint
 
     console.print(f"[green]Verifying {len(test_cases)} maps...[/green]")
     
     # Create verifier and verify maps
     verifier = MapVerifier(provider=verifier_provider)
+    if batch and not getattr(verifier.llm, "supports_batch", False):
+        console.print(f"[yellow]{verifier.provider} has no batch endpoint; verifying maps individually[/yellow]")
+    
+    # Reuse verdicts for maps whose bytes, prompt and verifier settings are
+    # unchanged; they live in <output>/.cache/<cache key>.json
+    output_path = Path(output)
+    cache_dir = output_path / ".cache"
+    cache_keys = [verifier.cache_key(test_case) for test_case in test_cases]
+    cached = {}
+    if not no_cache:
+        for index, key in enumerate(cache_keys):
+            cache_file = cache_dir / f"{key}.json"
+            if cache_file.exists():
+                result = VerificationResult(**_json_loads(cache_file.read_bytes()))
+                result.test_id = test_cases[index]["test_id"]
+                cached[index] = result
+                os.utime(cache_file)  # Mark as recently used
+        if cached:
+            console.print(f"[green]Reusing {len(cached)} cached verification result(s)[/green]")
+    pending = [index for index in range(len(test_cases)) if index not in cached]
     
     with Progress(
         SpinnerColumn(),
@@ -265,23 +327,36 @@ def verify(maps, prompts, results, output, example, ollama_endpoint, verifier_pr
         console=console
     ) as progress:
         task = progress.add_task("Verifying maps...", total=None)
-        verification_results = verifier.verify_maps(test_cases)
+        fresh = {"results": []}
+        if pending:
+            fresh = verifier.verify_maps_batch(
+                [test_cases[i] for i in pending], mode="batch" if batch else "sync", max_workers=workers
+            )
         progress.update(task, completed=True)
     
     # Create output directory and save results
-    output_path = Path(output)
-    output_path.mkdir(parents=True, exist_ok=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for index, result in zip(pending, fresh["results"]):
+        cached[index] = result
+        # LLM/runtime errors are transient; only cache real verdicts
+        if "error" not in result.qualitative_checks:
+            (cache_dir / f"{cache_keys[index]}.json").write_text(json.dumps(asdict(result), default=str))
+    entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[VERIFY_CACHE_SIZE:]:
+        stale.unlink()
+    verification_results = verifier.summarize_results([cached[i] for i in range(len(test_cases))])
     
     results_file = output_path / "verification_results.json"
     
     # Convert to JSON-serializable format
     json_results = {
-        "results": [r.model_dump() for r in verification_results["results"]],
+        "results": [asdict(r) for r in verification_results["results"]],
         "summary": verification_results["summary"]
     }
     
     with open(results_file, 'w') as f:
         json.dump(json_results, f, indent=2, default=str)
+    _write_summary(output_path, json_results["summary"])
     
     # Display results table
     table = Table(title="Verification Results")
@@ -337,6 +412,7 @@ def verify(maps, prompts, results, output, example, ollama_endpoint, verifier_pr
 
 
 main.add_command(report)
+main.add_command(prerender)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,3 @@
-import json
 import click
 from pathlib import Path
 from datetime import datetime
@@ -14,11 +13,20 @@ try:
 except Exception:
     Image = None  # type: ignore
 
+try:
+    # Optional faster JSON decoder for results and map files
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+_CSV_SEP_RE = re.compile(r"[\s,]+")
+
 
 def _parse_csv_layer(layer: ET.Element, width: int, height: int):
     data = layer.find("data")
     assert data is not None and data.get("encoding") == "csv"
-    raw = re.split(r"[\s,]+", data.text.strip())
+    raw = _CSV_SEP_RE.split(data.text.strip())
     nums = [int(x) for x in raw if x]
     assert len(nums) == width * height
     return [nums[i*width:(i+1)*width] for i in range(height)]
@@ -92,15 +100,45 @@ def _render_tmx_to_png(tmx_path: Path, out_png: Path) -> bool:
         return False
 
 
+def _ensure_rendered(map_id: str) -> bool:
+    """Render data/tmx/<id>.tmx to data/renders/<id>.png if the PNG is missing or stale.
+
+    Returns True if a rendered PNG exists afterwards.
+    """
+    rendered_abs = Path("data/renders") / f"{map_id}.png"
+    tmx_path = Path("data/tmx") / f"{map_id}.tmx"
+    if tmx_path.exists():
+        need = (not rendered_abs.exists()) or (tmx_path.stat().st_mtime > rendered_abs.stat().st_mtime)
+        if need:
+            _render_tmx_to_png(tmx_path, rendered_abs)
+    return rendered_abs.exists()
+
+
+def prerender_assets(generation_file: Path) -> int:
+    """Render PNGs for every successfully generated map ahead of the report.
+
+    Only needs generation results, so it can run while verification is in
+    progress; generate_html_report then finds the PNGs up to date.
+    Returns the number of maps with a rendered image.
+    """
+    gen_data = _json_loads(Path(generation_file).read_bytes())
+
+    rendered = 0
+    for gen_result in gen_data["results"]:
+        if gen_result.get("status") != "success":
+            continue
+        map_id = _json_loads(Path(gen_result["map_file"]).read_bytes())["id"]
+        if _ensure_rendered(map_id):
+            rendered += 1
+    return rendered
+
+
 def generate_html_report(generation_file: Path, verification_file: Path, output_file: Path):
     """Generate a nicely formatted HTML report."""
     
     # Load data
-    with open(generation_file, 'r') as f:
-        gen_data = json.load(f)
-    
-    with open(verification_file, 'r') as f:
-        ver_data = json.load(f)
+    gen_data = _json_loads(Path(generation_file).read_bytes())
+    ver_data = _json_loads(Path(verification_file).read_bytes())
     
     # Create lookup for verification results by test_id
     ver_lookup = {r["test_id"]: r for r in ver_data["results"]}
@@ -290,8 +328,7 @@ def generate_html_report(generation_file: Path, verification_file: Path, output_
 
         # Load map data
         map_file = Path(gen_result["map_file"])
-        with open(map_file, 'r') as f:
-            map_data_dict = json.load(f)
+        map_data_dict = _json_loads(map_file.read_bytes())
 
         map_data = MapData(**map_data_dict)
 
@@ -304,13 +341,7 @@ def generate_html_report(generation_file: Path, verification_file: Path, output_
 
         # Ensure rendered PNG exists for this map if TMX is present
         rendered_rel = Path("renders") / f"{map_data.id}.png"
-        rendered_abs = Path("data") / rendered_rel
-        tmx_path = Path("data/tmx") / f"{map_data.id}.tmx"
-        if tmx_path.exists():
-            need = (not rendered_abs.exists()) or (tmx_path.stat().st_mtime > rendered_abs.stat().st_mtime)
-            if need:
-                _render_tmx_to_png(tmx_path, rendered_abs)
-        has_image = rendered_abs.exists()
+        has_image = _ensure_rendered(map_data.id)
 
         # Determine score class
         score = ver_result.get("overall_score", 0)
@@ -543,5 +574,21 @@ def report(generation, verification, output):
     click.echo(f"🌐 Open in browser: file://{out_file.absolute()}")
 
 
+@click.command()
+@click.option("--generation", "-g", type=click.Path(exists=True),
+              default="data/generated/generation_results.json",
+              help="Generation results JSON file")
+def prerender(generation):
+    """Render map PNGs from TMX files ahead of report generation."""
+    gen_file = Path(generation)
+
+    if not gen_file.exists():
+        click.echo(f"Error: Generation file not found: {gen_file}")
+        return
+
+    rendered = prerender_assets(gen_file)
+    click.echo(f"✅ Pre-rendered {rendered} map image(s)")
+
+
 if __name__ == "__main__":
     report()
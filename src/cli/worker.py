@@ -0,0 +1,77 @@
+"""
+Long-lived CLI worker used by test_suite.py.
+
+Reads one JSON request per line from stdin, e.g.
+    {"cmd": "verify", "args": ["--example"]}
+runs it through the click group in this process and answers with one JSON
+line {"returncode": int}. Imports are paid once for the whole suite instead
+of once per phase. Command output goes to stderr so stdout stays a clean
+reply channel.
+
+`python -m src.cli.worker --prewarm` instead byte-compiles the package and
+builds numba's on-disk kernel cache, then exits.
+"""
+import compileall
+import json
+import os
+import sys
+import traceback
+from pathlib import Path
+
+import click
+
+from .main import main as cli
+
+
+def run(cmd: str, args: list) -> int:
+    """Run one CLI command and return its exit code."""
+    try:
+        cli.main([cmd, *args], prog_name="src.cli.main", standalone_mode=False)
+        return 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Abort:
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+def prewarm():
+    """Write .pyc files for src/ and JIT-compile the cached connectivity kernel.
+
+    Meant to run in the background at suite start, so later processes skip
+    compilation and load the flood fill from numba's cache instead of
+    compiling it on their first connectivity check.
+    """
+    from ..shared.connectivity import check_map_connectivity
+
+    compileall.compile_dir(Path(__file__).resolve().parents[1], quiet=1)
+    check_map_connectivity("...", 3, 1)
+
+
+def serve():
+    """Answer requests from stdin until it is closed."""
+    # Keep the real stdout for replies; point fd 1 (and sys.stdout) at stderr
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        returncode = run(request["cmd"], request.get("args", []))
+        sys.stdout.flush()
+        replies.write(json.dumps({"returncode": returncode}) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--prewarm"]:
+        prewarm()
+    else:
+        serve()
@@ -25,18 +25,25 @@ checkpoint("complete", full_verification=True)
 ```
 """
 
+import functools
+import hashlib
 import json
 import logging
+import math
+import pickle
 import time
-from typing import Dict, Any, List, Optional, Tuple, Union, Literal
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated, Dict, Any, List, Optional, Tuple, Union, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field, ValidationError
 from pydantic import ConfigDict
 from enum import Enum
 
-from ..shared.utils import load_config, load_secrets
+from ..shared.utils import load_config, load_secrets, compress_prompt
 from ..shared.models import MapData, EntityData, GenerationResult
 from ..shared.connectivity import check_map_connectivity
+from ..shared.llm_client import max_concurrency
 
 
 class EntityType(str, Enum):
@@ -171,19 +178,27 @@ class CheckpointCommand(BaseCommand):
     properties: Dict[str, Any] = Field(default_factory=dict, description="Optional checkpoint properties")
 
 
-# Union type for all commands
-DSLCommand = Union[
-    GridCommand,
-    RoomCommand,
-    DoorOnCommand,
-    ConnectByWallsCommand,
-    SpawnInCommand,
-    WaterAreaCommand,
-    RiverCommand,
-    CheckpointCommand
+# Union type for all commands, discriminated by the "type" tag so validation
+# dispatches straight to the matching model instead of trying each member
+DSLCommand = Annotated[
+    Union[
+        GridCommand,
+        RoomCommand,
+        DoorOnCommand,
+        ConnectByWallsCommand,
+        SpawnInCommand,
+        WaterAreaCommand,
+        RiverCommand,
+        CheckpointCommand
+    ],
+    Field(discriminator="type"),
 ]
 
 
+# Command types whose output is collected as checkpoint feedback
+CHECKPOINT_TYPES = frozenset({CheckpointCommand})
+
+
 class DSLProgram(BaseModel):
     """Complete DSL program with list of commands."""
     commands: List[DSLCommand] = Field(description="List of DSL commands to execute")
@@ -200,43 +215,39 @@ class DSLMapBuilder:
         self.entities: Dict[str, List[EntityData]] = {}
         self.checkpoints: Dict[str, Dict[str, Any]] = {}
         self.last_checkpoint = None
+        # Exact-type dispatch table; one dict lookup per command
+        self._dispatch = {
+            GridCommand: lambda c: self._cmd_grid(c.width, c.height),
+            RoomCommand: lambda c: self._cmd_room(c.name, c.x, c.y, c.width, c.height),
+            DoorOnCommand: lambda c: self._cmd_door_on(c.room, c.wall, c.at, c.offset, c.snap_to_valid),
+            ConnectByWallsCommand: lambda c: self._cmd_connect_by_walls(c.a, c.a_wall, c.b, c.b_wall, c.style),
+            SpawnInCommand: lambda c: self._cmd_spawn_in(c.entity, c.in_room, c.at, c.dx, c.dy, **c.properties),
+            WaterAreaCommand: lambda c: self._cmd_water_area(c.x, c.y, c.shape, c.radius,
+                                                             c.width, c.height, **c.properties),
+            RiverCommand: lambda c: self._cmd_river(c.points, c.width, **c.properties),
+            CheckpointCommand: lambda c: self._cmd_checkpoint(c.name, c.verify_connectivity,
+                                                              c.verify_entities, c.full_verification,
+                                                              c.stats, **c.properties),
+        }
         
     def execute_command(self, command: DSLCommand) -> str:
         """Execute a single DSL command from Pydantic model."""
-        if isinstance(command, GridCommand):
-            return self._cmd_grid(command.width, command.height)
-        elif isinstance(command, RoomCommand):
-            return self._cmd_room(command.name, command.x, command.y, command.width, command.height)
-        elif isinstance(command, DoorOnCommand):
-            return self._cmd_door_on(command.room, command.wall, command.at, command.offset, command.snap_to_valid)
-        elif isinstance(command, ConnectByWallsCommand):
-            return self._cmd_connect_by_walls(command.a, command.a_wall, command.b, command.b_wall, command.style)
-        elif isinstance(command, SpawnInCommand):
-            return self._cmd_spawn_in(command.entity, command.in_room, command.at, command.dx, command.dy, **command.properties)
-        elif isinstance(command, WaterAreaCommand):
-            return self._cmd_water_area(command.x, command.y, command.shape, command.radius,
-                                       command.width, command.height, **command.properties)
-        elif isinstance(command, RiverCommand):
-            return self._cmd_river(command.points, command.width, **command.properties)
-        elif isinstance(command, CheckpointCommand):
-            return self._cmd_checkpoint(command.name, command.verify_connectivity,
-                                       command.verify_entities, command.full_verification,
-                                       command.stats, **command.properties)
-        else:
+        handler = self._dispatch.get(type(command))
+        if handler is None:
             raise DSLExecutionError(f"Unknown command type: {type(command)}")
+        return handler(command)
     
     def _cmd_grid(self, width: int, height: int) -> str:
         """Initialize grid: grid(20, 15)"""
         if width != self.target_width or height != self.target_height:
             raise DSLExecutionError(f"Grid must be {self.target_width}x{self.target_height}, got {width}x{height}")
         
-        self.grid = [['#' for _ in range(width)] for _ in range(height)]
+        self.grid = [['#'] * width for _ in range(height)]
         self.labels = [[set() for _ in range(width)] for _ in range(height)]
         
         # Create interior space
-        for i in range(1, height - 1):
-            for j in range(1, width - 1):
-                self.grid[i][j] = '.'
+        for row in self.grid[1:-1]:
+            row[1:-1] = ['.'] * (width - 2)
         
         return f"Created {width}x{height} grid"
     
@@ -248,26 +259,29 @@ class DSLMapBuilder:
         if not self._validate_bounds(x, y, width, height):
             raise DSLExecutionError(f"Room '{name}' at ({x},{y}) size {width}x{height} exceeds bounds")
         
-        # Place room walls and floor with labels
+        # Place room walls and floor as whole row slices
+        wall_row = ['#'] * width
+        inner_row = ['#'] + ['.'] * (width - 2) + ['#'] if width >= 2 else wall_row
+        for i in range(y, y + height):
+            self.grid[i][x:x + width] = wall_row if i == y or i == y + height - 1 else inner_row
+        
+        # Label every tile of the room
         for i in range(y, y + height):
             for j in range(x, x + width):
                 self._clear_room_labels(j, i)
                 if i == y or i == y + height - 1:
-                    self.grid[i][j] = '#'
                     self._add_label(j, i, f"room:{name}")
                     side = "north" if i == y else "south"
                     self._add_label(j, i, f"wall:{side}")
                     idx = j - x
                     self._add_label(j, i, f"wall_index:{idx}")
                 elif j == x or j == x + width - 1:
-                    self.grid[i][j] = '#'
                     self._add_label(j, i, f"room:{name}")
                     side = "west" if j == x else "east"
                     self._add_label(j, i, f"wall:{side}")
                     idx = i - y
                     self._add_label(j, i, f"wall_index:{idx}")
                 else:
-                    self.grid[i][j] = '.'
                     self._add_label(j, i, f"room:{name}")
                     self._add_label(j, i, "interior")
         
@@ -353,9 +367,8 @@ class DSLMapBuilder:
         tx, ty = outside(bx, by, b_wall)
         def carve_line(x0, y0, x1, y1):
             start_x, end_x = (x0, x1) if x0 <= x1 else (x1, x0)
-            for x in range(start_x, end_x + 1):
-                if self._in_bounds(x, y0):
-                    self.grid[y0][x] = '.'
+            if 0 <= y0 < self.target_height:
+                self._fill_span(y0, max(0, start_x), min(self.target_width - 1, end_x), '.')
             start_y, end_y = (y0, y1) if y0 <= y1 else (y1, y0)
             for y in range(start_y, end_y + 1):
                 if self._in_bounds(x1, y):
@@ -409,19 +422,16 @@ class DSLMapBuilder:
         if not self.grid:
             raise DSLExecutionError("Must create grid first")
         
+        # Water never touches the border; fill one clipped row span at a time
+        max_x, max_y = self.target_width - 2, self.target_height - 2
         if shape.lower() == "circle":
-            for yy in range(y - radius, y + radius + 1):
-                for xx in range(x - radius, x + radius + 1):
-                    if (0 < xx < self.target_width - 1 and 
-                        0 < yy < self.target_height - 1 and
-                        (xx - x) ** 2 + (yy - y) ** 2 <= radius ** 2):
-                        self.grid[yy][xx] = '~'
+            for yy in range(max(1, y - radius), min(max_y, y + radius) + 1):
+                half = math.isqrt(radius * radius - (yy - y) ** 2)
+                self._fill_span(yy, max(1, x - half), min(max_x, x + half), '~')
         elif shape.lower() == "rectangle":
             x0, y0 = x - width // 2, y - height // 2
-            for yy in range(y0, y0 + height):
-                for xx in range(x0, x0 + width):
-                    if 0 < xx < self.target_width - 1 and 0 < yy < self.target_height - 1:
-                        self.grid[yy][xx] = '~'
+            for yy in range(max(1, y0), min(max_y, y0 + height - 1) + 1):
+                self._fill_span(yy, max(1, x0), min(max_x, x0 + width - 1), '~')
         else:
             raise DSLExecutionError(f"Unknown water shape: {shape}")
         
@@ -436,6 +446,7 @@ class DSLMapBuilder:
             raise DSLExecutionError("River requires at least 2 points")
         
         half_width = max(0, (width - 1) // 2)
+        max_x, max_y = self.target_width - 2, self.target_height - 2
         
         def draw_line(x0, y0, x1, y1):
             # Bresenham's line algorithm with width
@@ -447,11 +458,10 @@ class DSLMapBuilder:
             x, y = x0, y0
             
             while True:
-                for oy in range(-half_width, half_width + 1):
-                    for ox in range(-half_width, half_width + 1):
-                        nx, ny = x + ox, y + oy
-                        if 0 < nx < self.target_width - 1 and 0 < ny < self.target_height - 1:
-                            self.grid[ny][nx] = '~'
+                # Square brush, clipped to the interior
+                lo, hi = max(1, x - half_width), min(max_x, x + half_width)
+                for ny in range(max(1, y - half_width), min(max_y, y + half_width) + 1):
+                    self._fill_span(ny, lo, hi, '~')
                 
                 if x == x1 and y == y1:
                     break
@@ -488,22 +498,22 @@ class DSLMapBuilder:
         # Build checkpoint report
         report = [f"📍 CHECKPOINT: {name}"]
         
-        # Always show map visualization
+        # Always show map visualization; the same string feeds stats and connectivity
+        tiles_str = self._get_grid_visualization()
         report.append("\nMap:")
-        report.append(self._get_grid_visualization())
+        report.append(tiles_str)
         
         # Optional statistics
         if stats or full_verification:
-            wall_count = sum(row.count('#') for row in self.grid)
-            floor_count = sum(row.count('.') for row in self.grid)
-            door_count = sum(row.count('+') for row in self.grid)
-            water_count = sum(row.count('~') for row in self.grid)
+            wall_count = tiles_str.count('#')
+            floor_count = tiles_str.count('.')
+            door_count = tiles_str.count('+')
+            water_count = tiles_str.count('~')
             
             report.append(f"\nStats: {wall_count} walls, {floor_count} floors, {door_count} doors, {water_count} water")
         
         # Optional connectivity check
         if verify_connectivity or full_verification:
-            tiles_str = '\n'.join(''.join(row) for row in self.grid)
             connected = check_map_connectivity(tiles_str, self.target_width, self.target_height)
             status = "✅ CONNECTED" if connected else "❌ NOT CONNECTED"
             report.append(f"\nConnectivity: {status}")
@@ -552,10 +562,12 @@ class DSLMapBuilder:
         if not self.grid:
             return "No grid created"
         
-        lines = []
-        for row in self.grid:
-            lines.append(''.join(row))
-        return '\n'.join(lines)
+        return '\n'.join(map(''.join, self.grid))
+
+    def _fill_span(self, y: int, x0: int, x1: int, tile: str):
+        """Set grid[y][x0..x1] (inclusive) to tile with one slice assignment."""
+        if x0 <= x1:
+            self.grid[y][x0:x1 + 1] = [tile] * (x1 - x0 + 1)
 
     # Label helpers
     def _add_label(self, x: int, y: int, label: str):
@@ -572,10 +584,10 @@ class DSLMapBuilder:
         coords: List[Tuple[int, int]] = []
         if self.labels is None:
             return coords
-        for yy in range(self.target_height):
-            for xx in range(self.target_width):
-                labs = self.labels[yy][xx]
-                if f"room:{room}" in labs and f"wall:{wall}" in labs:
+        room_label, wall_label = f"room:{room}", f"wall:{wall}"
+        for yy, row in enumerate(self.labels):
+            for xx, labs in enumerate(row):
+                if room_label in labs and wall_label in labs:
                     coords.append((xx, yy))
         if wall in ("north", "south"):
             coords.sort(key=lambda p: p[0])
@@ -587,10 +599,10 @@ class DSLMapBuilder:
         coords: List[Tuple[int, int]] = []
         if self.labels is None:
             return coords
-        for yy in range(self.target_height):
-            for xx in range(self.target_width):
-                labs = self.labels[yy][xx]
-                if f"room:{room}" in labs and 'interior' in labs and self.grid[yy][xx] in ['.', '+']:
+        room_label = f"room:{room}"
+        for yy, (row, tiles) in enumerate(zip(self.labels, self.grid)):
+            for xx, labs in enumerate(row):
+                if room_label in labs and 'interior' in labs and tiles[xx] in ('.', '+'):
                     coords.append((xx, yy))
         return coords
     
@@ -599,13 +611,13 @@ class DSLMapBuilder:
         if not self.grid:
             raise ValueError("No grid created")
         
-        tiles = '\n'.join(''.join(row) for row in self.grid)
+        tiles = self._get_grid_visualization()
         
         # Count tiles
-        wall_count = sum(row.count('#') for row in self.grid)
-        floor_count = sum(row.count('.') for row in self.grid)
-        door_count = sum(row.count('+') for row in self.grid)
-        water_count = sum(row.count('~') for row in self.grid)
+        wall_count = tiles.count('#')
+        floor_count = tiles.count('.')
+        door_count = tiles.count('+')
+        water_count = tiles.count('~')
         
         # Check connectivity
         connectivity_verified = check_map_connectivity(tiles, self.target_width, self.target_height)
@@ -630,29 +642,125 @@ class DSLMapBuilder:
         )
 
 
+# Bump whenever the command models change so on-disk parse caches are invalidated
+DSL_GRAMMAR_VERSION = 1
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_program_cached(program_json: str) -> Tuple[DSLCommand, ...]:
+    """Parse and validate a JSON DSL program. Memoized per source string."""
+    try:
+        # Decode and validate in a single pass inside pydantic-core
+        dsl_program = DSLProgram.model_validate_json(program_json)
+        
+        return tuple(dsl_program.commands)
+        
+    except ValidationError as e:
+        errors = e.errors()
+        if errors and errors[0]['type'] == 'json_invalid':
+            raise DSLExecutionError(f"Invalid JSON: {errors[0]['ctx']['error']}")
+        # Format Pydantic validation errors for better feedback
+        error_details = []
+        for error in errors:
+            location = " -> ".join(str(x) for x in error['loc'])
+            error_details.append(f"{location}: {error['msg']}")
+        raise DSLExecutionError(f"Validation errors:\n" + "\n".join(error_details))
+
+
 class DSLParser:
-    """Parses JSON DSL programs using Pydantic validation."""
+    """Parses JSON DSL programs using Pydantic validation.
+    
+    Parsed programs are memoized in-process. With cache_dir set, they are also
+    pickled to <cache_dir>/<blake2b(grammar version + source)>.pkl so identical
+    programs are not re-validated across runs.
+    """
+    
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
     
     def parse_program(self, program_json: str) -> List[DSLCommand]:
         """Parse JSON DSL program into validated command objects."""
+        if self.cache_dir is None:
+            return list(_parse_program_cached(program_json))
+        
+        key = hashlib.blake2b(f"{DSL_GRAMMAR_VERSION}\0{program_json}".encode("utf-8")).hexdigest()
+        cache_file = self.cache_dir / f"{key}.pkl"
         try:
-            # Parse JSON
-            program_data = json.loads(program_json)
-            
-            # Validate against Pydantic model
-            dsl_program = DSLProgram(**program_data)
-            
-            return dsl_program.commands
-            
-        except json.JSONDecodeError as e:
-            raise DSLExecutionError(f"Invalid JSON: {e}")
-        except ValidationError as e:
-            # Format Pydantic validation errors for better feedback
-            error_details = []
-            for error in e.errors():
-                location = " -> ".join(str(x) for x in error['loc'])
-                error_details.append(f"{location}: {error['msg']}")
-            raise DSLExecutionError(f"Validation errors:\n" + "\n".join(error_details))
+            with open(cache_file, "rb") as f:
+                return list(pickle.load(f))
+        except Exception:
+            pass  # Missing or unreadable cache entry; parse from source
+        
+        commands = _parse_program_cached(program_json)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(commands, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file.replace(cache_file)
+        except OSError:
+            pass  # Caching is best-effort
+        return list(commands)
+
+
+# System prompt for JSON DSL generation (labels; door_on/connect_by_walls; region spawns)
+_DSL_SYSTEM_PROMPT = """You are a roguelike map generator that creates maps using JSON commands.
+
+RESPOND WITH JSON ONLY in this format:
+{"commands": [list_of_command_objects]}
+
+COMMANDS:
+- {"type": "grid", "width": 20, "height": 15} - Initialize 20x15 map
+- {"type": "room", "name": "string", "x": int, "y": int, "width": int, "height": int} - Create room (labels tiles: room:<name>, wall:<side>, interior)
+- {"type": "door_on", "room": "name", "wall": "north|south|east|west", "at": "center|start|end", "offset": int} - Place a door on a room wall (no raw coordinates)
+ - {"type": "door_on", "room": "name", "wall": "north|south|east|west", "at": "center|start|end", "offset": int, "snap_to_valid": false} - Place a door on a room wall (set snap_to_valid=true to clamp to nearest valid position; may use corners if wall is very short)
+- {"type": "connect_by_walls", "a": "roomA", "a_wall": "east", "b": "roomB", "b_wall": "west", "style": "L|I"} - Place doors on both walls and carve corridor
+- {"type": "spawn", "entity": "string", "in": "room", "at": "center", "dx": 0, "dy": 0} - Spawn in a room region
+- {"type": "water_area", "x": int, "y": int, "shape": "circle|rectangle", "radius": int} - Water (optional)
+- {"type": "river", "points": [[x,y], [x,y], ...], "width": int} - River path (optional)
+- {"type": "checkpoint", "name": "string", "verify_connectivity": false, "full_verification": false} - Checkpoint
+
+ENTITY TYPES: player, ogre, goblin, shop, chest, tomb, spirit, human
+
+CRITICAL RULES:
+1. MUST have exactly one "player" spawn
+2. Grid MUST be 20x15
+3. Only use door_on/connect_by_walls for doors; do NOT place doors by raw coordinates
+4. Use checkpoints: after structure, after connectivity (verify_connectivity=true), final (full_verification=true)
+5. Bounds (0-indexed): x in [0,19], y in [0,14]; rooms must fit: x+width<=20, y+height<=15
+6. door_on offset hint: do not use 0; valid offsets are 1..(wall_length-2). Prefer at:"center" when unsure.
+7. Entities must not overlap; ensure each entity is on a distinct tile (use at:"center" with small dx/dy for variety).
+8. Minimum room size for door_on: rooms should be at least 3x3 so each wall has a non-corner tile; if a wall is too short, either choose a different wall or increase room size.
+9. connect_by_walls places doors automatically on both walls; do not also add a separate door_on for the same connection.
+10. Do not model 1-tile-thick corridors as rooms needing door_on; use connect_by_walls to create connections.
+
+EXAMPLE:
+{
+  "commands": [
+    {"type": "grid", "width": 20, "height": 15},
+    {"type": "room", "name": "tavern", "x": 4, "y": 3, "width": 10, "height": 6},
+    {"type": "room", "name": "hall", "x": 12, "y": 6, "width": 6, "height": 5},
+    {"type": "door_on", "room": "tavern", "wall": "north", "at": "center"},
+    {"type": "connect_by_walls", "a": "tavern", "a_wall": "east", "b": "hall", "b_wall": "west", "style": "L"},
+    {"type": "checkpoint", "name": "structure"},
+    {"type": "spawn", "entity": "player", "in": "tavern", "at": "center"},
+    {"type": "spawn", "entity": "goblin", "in": "hall", "dx": 1},
+    {"type": "checkpoint", "name": "connected", "verify_connectivity": true},
+    {"type": "checkpoint", "name": "complete", "full_verification": true}
+  ]
+}
+
+Generate valid JSON only."""
+
+# Additional guidance for Ollama models (only) to improve adherence
+_OLLAMA_DSL_GUIDANCE = """
+
+Ollama-specific guidance:
+- Prefer at:"center" for door_on unless the wall is long; only use numeric offset within 1..(wall_length-2).
+- Do NOT overlap rooms; preserve at least a 1-tile gap unless connecting via connect_by_walls. Overlap erases wall labels and shortens walls.
+- If connect_by_walls reports a wall length 0, switch to another wall with length ≥ 3 or enlarge the room slightly.
+- The 'commands' array must contain only JSON objects with a 'type' field — no nulls, empty objects, or comments.
+"""
 
 
 class DSLMapGenerator:
@@ -707,20 +815,30 @@ class DSLMapGenerator:
         self.provider = provider
         self.verbose = verbose
         self.logger = logging.getLogger(__name__)
-        self.parser = DSLParser()
+        # Optional on-disk parse cache, e.g. "dsl": {"parse_cache_dir": "data/.parse_cache"}
+        self.parser = DSLParser(cache_dir=self.config.get("dsl", {}).get("parse_cache_dir"))
+        
+        # Build and compress the system prompt once; "dsl": {"prompt_compression": "lite"|"full"|"off"}
+        system_prompt = _DSL_SYSTEM_PROMPT
+        if provider == "ollama":
+            system_prompt += _OLLAMA_DSL_GUIDANCE
+        compression = self.config.get("dsl", {}).get("prompt_compression", "lite")
+        self.system_prompt = system_prompt if compression == "off" else compress_prompt(system_prompt, compression)
+        self.logger.debug(f"DSL system prompt: {len(system_prompt)} -> {len(self.system_prompt)} chars")
     
     def generate_maps(self, prompts: List[str]) -> Dict[str, Any]:
         """Generate maps for multiple prompts."""
-        results = []
-        total_time = 0
-        
-        for i, prompt in enumerate(prompts):
-            start_time = time.time()
-            result = self._generate_single_map(prompt, i)
-            generation_time = time.time() - start_time
-            result.generation_time = generation_time
-            total_time += generation_time
-            results.append(result)
+        # Prompts are independent, so keep several requests in flight where the
+        # backend has slots for them; local Ollama defaults to one at a time,
+        # see llm_client.max_concurrency.
+        max_workers = max_concurrency(self.config, self.provider)
+        self.client.parallel_requests = max_workers
+        if max_workers == 1:
+            results = [self._timed_single_map(prompt, index) for index, prompt in enumerate(prompts)]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(self._timed_single_map, prompts, range(len(prompts))))
+        total_time = sum(r.generation_time for r in results)
         
         successful = len([r for r in results if r.status == "success"])
         summary = {
@@ -735,6 +853,13 @@ class DSLMapGenerator:
             "summary": summary
         }
     
+    def _timed_single_map(self, prompt: str, index: int) -> GenerationResult:
+        """Generate a single map and record its wall-clock generation time."""
+        start_time = time.perf_counter()
+        result = self._generate_single_map(prompt, index)
+        result.generation_time = time.perf_counter() - start_time
+        return result
+    
     def _generate_single_map(self, prompt: str, index: int) -> GenerationResult:
         """Generate a single map from a prompt."""
         try:
@@ -764,66 +889,7 @@ class DSLMapGenerator:
         """Generate a map using DSL approach."""
         self.logger.info(f"Generating map {map_id} with DSL: {prompt}")
         
-        # System prompt for JSON DSL generation (labels; door_on/connect_by_walls; region spawns)
-        system_prompt = """You are a roguelike map generator that creates maps using JSON commands.
-
-RESPOND WITH JSON ONLY in this format:
-{"commands": [list_of_command_objects]}
-
-COMMANDS:
-- {"type": "grid", "width": 20, "height": 15} - Initialize 20x15 map
-- {"type": "room", "name": "string", "x": int, "y": int, "width": int, "height": int} - Create room (labels tiles: room:<name>, wall:<side>, interior)
-- {"type": "door_on", "room": "name", "wall": "north|south|east|west", "at": "center|start|end", "offset": int} - Place a door on a room wall (no raw coordinates)
- - {"type": "door_on", "room": "name", "wall": "north|south|east|west", "at": "center|start|end", "offset": int, "snap_to_valid": false} - Place a door on a room wall (set snap_to_valid=true to clamp to nearest valid position; may use corners if wall is very short)
-- {"type": "connect_by_walls", "a": "roomA", "a_wall": "east", "b": "roomB", "b_wall": "west", "style": "L|I"} - Place doors on both walls and carve corridor
-- {"type": "spawn", "entity": "string", "in": "room", "at": "center", "dx": 0, "dy": 0} - Spawn in a room region
-- {"type": "water_area", "x": int, "y": int, "shape": "circle|rectangle", "radius": int} - Water (optional)
-- {"type": "river", "points": [[x,y], [x,y], ...], "width": int} - River path (optional)
-- {"type": "checkpoint", "name": "string", "verify_connectivity": false, "full_verification": false} - Checkpoint
-
-ENTITY TYPES: player, ogre, goblin, shop, chest, tomb, spirit, human
-
-CRITICAL RULES:
-1. MUST have exactly one "player" spawn
-2. Grid MUST be 20x15
-3. Only use door_on/connect_by_walls for doors; do NOT place doors by raw coordinates
-4. Use checkpoints: after structure, after connectivity (verify_connectivity=true), final (full_verification=true)
-5. Bounds (0-indexed): x in [0,19], y in [0,14]; rooms must fit: x+width<=20, y+height<=15
-6. door_on offset hint: do not use 0; valid offsets are 1..(wall_length-2). Prefer at:"center" when unsure.
-7. Entities must not overlap; ensure each entity is on a distinct tile (use at:"center" with small dx/dy for variety).
-8. Minimum room size for door_on: rooms should be at least 3x3 so each wall has a non-corner tile; if a wall is too short, either choose a different wall or increase room size.
-9. connect_by_walls places doors automatically on both walls; do not also add a separate door_on for the same connection.
-10. Do not model 1-tile-thick corridors as rooms needing door_on; use connect_by_walls to create connections.
-
-EXAMPLE:
-{
-  "commands": [
-    {"type": "grid", "width": 20, "height": 15},
-    {"type": "room", "name": "tavern", "x": 4, "y": 3, "width": 10, "height": 6},
-    {"type": "room", "name": "hall", "x": 12, "y": 6, "width": 6, "height": 5},
-    {"type": "door_on", "room": "tavern", "wall": "north", "at": "center"},
-    {"type": "connect_by_walls", "a": "tavern", "a_wall": "east", "b": "hall", "b_wall": "west", "style": "L"},
-    {"type": "checkpoint", "name": "structure"},
-    {"type": "spawn", "entity": "player", "in": "tavern", "at": "center"},
-    {"type": "spawn", "entity": "goblin", "in": "hall", "dx": 1},
-    {"type": "checkpoint", "name": "connected", "verify_connectivity": true},
-    {"type": "checkpoint", "name": "complete", "full_verification": true}
-  ]
-}
-
-Generate valid JSON only."""
-
-        # Additional guidance for Ollama models (only) to improve adherence
-        if self.provider == "ollama":
-            system_prompt += """
-
-Ollama-specific guidance:
-- Prefer at:"center" for door_on unless the wall is long; only use numeric offset within 1..(wall_length-2).
-- Do NOT overlap rooms; preserve at least a 1-tile gap unless connecting via connect_by_walls. Overlap erases wall labels and shortens walls.
-- If connect_by_walls reports a wall length 0, switch to another wall with length ≥ 3 or enlarge the room slightly.
-- The 'commands' array must contain only JSON objects with a 'type' field — no nulls, empty objects, or comments.
-"""
-
+        system_prompt = self.system_prompt
         user_prompt = f'Create a DSL program for: "{prompt}"'
         
         # Honor configured retry count
@@ -989,7 +1055,7 @@ Previous JSON:
                 result = builder.execute_command(command)
                 
                 # Collect checkpoint outputs for feedback
-                if isinstance(command, CheckpointCommand):
+                if type(command) in CHECKPOINT_TYPES:
                     checkpoint_outputs.append(result)
                     
             except DSLExecutionError as e:
@@ -1036,7 +1102,7 @@ if __name__ == "__main__":
         builder = DSLMapBuilder()
         for command in commands:
             result = builder.execute_command(command)
-            if isinstance(command, CheckpointCommand):
+            if type(command) in CHECKPOINT_TYPES:
                 print(f"\n{result}\n")
     
     except Exception as e:
@@ -6,12 +6,17 @@ import json
 import os
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import requests
 
 from ..shared.utils import load_config, load_secrets
 from ..shared.models import MapData, EntityData, GenerationResult
+from ..shared.llm_client import max_concurrency, thread_session
+
+# Seconds an Ollama chat request may take when it is the only one in flight
+_REQUEST_TIMEOUT = 120
 
 
 class OllamaGridBuilder:
@@ -400,9 +405,13 @@ class OllamaGridBuilder:
 class OllamaToolBasedGenerator:
     """Map generator using Ollama function calling for guaranteed constraints."""
     
-    def __init__(self, config_file: str = "generator.json"):
+    def __init__(self, config_file: str = "generator.json", session: requests.Session = None):
         self.config = load_config(config_file)
         self.logger = logging.getLogger(__name__)
+        # Reuse keep-alive connections to the Ollama server across requests
+        self._session = session
+        # Requests generate_maps keeps in flight; queued ones wait on the server
+        self.parallel_requests = 1
         
         # Ollama configuration
         ollama_cfg = self.config.get("ollama", {})
@@ -554,18 +563,24 @@ class OllamaToolBasedGenerator:
             "function": t
         } for t in base_tools]
     
+    @property
+    def session(self) -> requests.Session:
+        """The injected session, else the calling thread's keep-alive session."""
+        return self._session or thread_session()
+    
     def generate_maps(self, prompts: List[str]) -> Dict[str, Any]:
         """Generate maps for multiple prompts (interface compatibility with ToolBasedMapGenerator)."""
-        results = []
-        total_time = 0
-        
-        for i, prompt in enumerate(prompts):
-            start_time = time.time()
-            result = self._generate_single_map(prompt, i)
-            generation_time = time.time() - start_time
-            result.generation_time = generation_time
-            total_time += generation_time
-            results.append(result)
+        # Prompts are independent, so several requests can be in flight when
+        # the server has slots for them (OLLAMA_NUM_PARALLEL); the default is
+        # one at a time, see llm_client.max_concurrency.
+        max_workers = max_concurrency(self.config, "ollama")
+        self.parallel_requests = max_workers
+        if max_workers == 1:
+            results = [self._timed_single_map(prompt, index) for index, prompt in enumerate(prompts)]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(self._timed_single_map, prompts, range(len(prompts))))
+        total_time = sum(r.generation_time for r in results)
         
         # Summary
         successful = len([r for r in results if r.status == "success"])
@@ -581,6 +596,13 @@ class OllamaToolBasedGenerator:
             "summary": summary
         }
     
+    def _timed_single_map(self, prompt: str, index: int) -> GenerationResult:
+        """Generate a single map and record its wall-clock generation time."""
+        start_time = time.perf_counter()
+        result = self._generate_single_map(prompt, index)
+        result.generation_time = time.perf_counter() - start_time
+        return result
+    
     def _generate_single_map(self, prompt: str, index: int) -> GenerationResult:
         """Generate a single map from a prompt."""
         try:
@@ -893,7 +915,7 @@ This is a critical requirement - maps without players are unplayable!"""
                 "tool_choice": "required"
             }
             
-            response = requests.post(url, json=payload, timeout=120)
+            response = self.session.post(url, json=payload, timeout=_REQUEST_TIMEOUT * self.parallel_requests)
             try:
                 response.raise_for_status()
             except requests.HTTPError as http_err:
@@ -912,7 +934,7 @@ This is a critical requirement - maps without players are unplayable!"""
                         "temperature": self.temperature,
                         "stream": False,
                     }
-                    oai_resp = requests.post(oai_url, json=oai_payload, timeout=120)
+                    oai_resp = self.session.post(oai_url, json=oai_payload, timeout=_REQUEST_TIMEOUT * self.parallel_requests)
                     oai_resp.raise_for_status()
                     oai = oai_resp.json()
                     choice = (oai.get("choices") or [{}])[0]
@@ -1032,7 +1054,7 @@ This is a critical requirement - maps without players are unplayable!"""
             "options": {"temperature": self.temperature},
         }
 
-        r = requests.post(url, json=payload, timeout=120)
+        r = self.session.post(url, json=payload, timeout=_REQUEST_TIMEOUT * self.parallel_requests)
         r.raise_for_status()
         data = r.json()
         text = (data.get("response") or "").strip()
@@ -5,6 +5,14 @@ from typing import Tuple, Optional, Dict, Any, List
 import re
 
 
+# Position parsers run on every tool call; compile their patterns once
+_GRID_REF_RE = re.compile(r'^([A-Z])(\d+)$')
+_DIRECTION_RE = re.compile(r'(\d+)\s*tiles?\s*(north|south|east|west|up|down|left|right)\s*of\s*([a-zA-Z0-9_]+)')
+_CENTER_RE = re.compile(r'center\s+of\s+([a-zA-Z0-9_]+)')
+_ZONE_RE = re.compile(r'^([a-zA-Z]+)(?:\s+([a-zA-Z]+))?$')
+_COORDS_RE = re.compile(r'^\(?(\d+)\s*,\s*(\d+)\)?$')
+
+
 class GridReferencePositioning:
     """Grid reference positioning system (like chess notation)."""
     
@@ -16,7 +24,7 @@ class GridReferencePositioning:
         
     def grid_ref_to_coords(self, grid_ref: str) -> Optional[Tuple[int, int]]:
         """Convert grid reference (e.g., 'B3') to coordinates."""
-        match = re.match(r'^([A-Z])(\d+)$', grid_ref.upper())
+        match = _GRID_REF_RE.match(grid_ref.upper())
         if not match:
             return None
             
@@ -70,8 +78,7 @@ class RelativePositioning:
         description = description.lower().strip()
         
         # Pattern: "X tiles [direction] of [landmark]"
-        direction_pattern = r'(\d+)\s*tiles?\s*(north|south|east|west|up|down|left|right)\s*of\s*([a-zA-Z0-9_]+)'
-        match = re.search(direction_pattern, description)
+        match = _DIRECTION_RE.search(description)
         
         if match:
             distance = int(match.group(1))
@@ -92,8 +99,7 @@ class RelativePositioning:
                     return (base_x - distance, base_y)
         
         # Pattern: "center of [landmark]"
-        center_pattern = r'center\s+of\s+([a-zA-Z0-9_]+)'
-        match = re.search(center_pattern, description)
+        match = _CENTER_RE.search(description)
         if match:
             landmark = match.group(1)
             if landmark in self.landmarks:
@@ -184,7 +190,7 @@ class SmartPositioning:
     def parse_position(self, position_input: str) -> Optional[Tuple[int, int]]:
         """Try to parse a position using multiple positioning systems."""
         # Try grid reference first (most precise)
-        if re.match(r'^[A-Z]\d+$', position_input.upper()):
+        if _GRID_REF_RE.match(position_input.upper()):
             coords = self.grid_ref.grid_ref_to_coords(position_input)
             if coords:
                 return coords
@@ -195,7 +201,7 @@ class SmartPositioning:
             return coords
         
         # Try zone positioning
-        zone_match = re.match(r'^([a-zA-Z]+)(?:\s+([a-zA-Z]+))?$', position_input.lower())
+        zone_match = _ZONE_RE.match(position_input.lower())
         if zone_match:
             zone_name = zone_match.group(1)
             position = zone_match.group(2) or "center"
@@ -204,7 +210,7 @@ class SmartPositioning:
                 return coords
         
         # Try raw coordinates as fallback
-        coord_match = re.match(r'^\(?(\d+)\s*,\s*(\d+)\)?$', position_input)
+        coord_match = _COORDS_RE.match(position_input)
         if coord_match:
             x, y = int(coord_match.group(1)), int(coord_match.group(2))
             if 0 <= x < self.grid_ref.width and 0 <= y < self.grid_ref.height:
@@ -334,9 +334,9 @@ class SmartPositioningGenerator:
         results: List[GenerationResult] = []
         total_time = 0.0
         for i, prompt in enumerate(prompts):
-            start = time.time()
+            start = time.perf_counter()
             res = self._generate_single_map(prompt, i)
-            res.generation_time = time.time() - start
+            res.generation_time = time.perf_counter() - start
             total_time += res.generation_time
             results.append(res)
 
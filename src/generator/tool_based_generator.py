@@ -553,9 +553,9 @@ class ToolBasedMapGenerator:
         total_time = 0
         
         for i, prompt in enumerate(prompts):
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = self._generate_single_map(prompt, i)
-            generation_time = time.time() - start_time
+            generation_time = time.perf_counter() - start_time
             result.generation_time = generation_time
             total_time += generation_time
             results.append(result)
@@ -0,0 +1,71 @@
+"""
+Optional Numba-compiled flood fill used by the connectivity checks.
+
+numpy and numba are optional dependencies. When either is missing,
+NUMBA_AVAILABLE is False and callers fall back to the pure-Python BFS.
+"""
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    np = None  # type: ignore
+    NUMBA_AVAILABLE = False
+
+
+_DOT = 46   # ord('.')
+_PLUS = 43  # ord('+')
+
+
+def tiles_to_grid(lines):
+    """Convert validated map rows into an (H, W) uint8 grid of character codes."""
+    return np.frombuffer(''.join(lines).encode('ascii', 'replace'), dtype=np.uint8).reshape(len(lines), -1)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def flood_fill_reachable(grid, H, W, sx, sy):
+        """Count floor/door tiles reachable from (sx, sy). Returns the count.
+
+        Runs without the GIL, so checks from concurrent generator or
+        verifier threads execute in parallel.
+        """
+        # Visited flags as a bitset over flat indices i = y*W + x
+        visited = np.zeros((H * W + 7) // 8, dtype=np.uint8)
+        stack = np.empty(H * W, dtype=np.int32)
+        flat = grid.ravel()
+        start = sy * W + sx
+        visited[start >> 3] |= np.uint8(1 << (start & 7))
+        stack[0] = start
+        top = 1
+        count = 1
+        while top > 0:
+            top -= 1
+            i = stack[top]
+            x = i % W
+            for d in range(4):
+                if d == 0:
+                    if i < W:
+                        continue
+                    j = i - W
+                elif d == 1:
+                    if i >= (H - 1) * W:
+                        continue
+                    j = i + W
+                elif d == 2:
+                    if x == 0:
+                        continue
+                    j = i - 1
+                else:
+                    if x == W - 1:
+                        continue
+                    j = i + 1
+                bit = np.uint8(1 << (j & 7))
+                if visited[j >> 3] & bit == 0:
+                    c = flat[j]
+                    if c == _DOT or c == _PLUS:
+                        visited[j >> 3] |= bit
+                        stack[top] = j
+                        top += 1
+                        count += 1
+        return count
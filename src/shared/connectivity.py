@@ -2,8 +2,31 @@
 Shared connectivity checking utilities for roguelike maps.
 Ensures consistent connectivity validation across generator and verifier.
 """
+from collections import deque
 from typing import List, Dict, Any, Tuple, Set
 
+from . import _connectivity_numba
+
+# Cleared after the first failed kernel call so later checks go straight to BFS
+_use_numba = _connectivity_numba.NUMBA_AVAILABLE
+
+
+def _compiled_reachable(lines: List[str], width: int, height: int, start: Tuple[int, int]):
+    """Reachable count from the numba flood fill, or None to use the Python BFS.
+    
+    Loading numba's on-disk cache can fail, e.g. when it was written while this
+    package was imported under another name (shared vs src.shared).
+    """
+    global _use_numba
+    if not _use_numba:
+        return None
+    try:
+        grid = _connectivity_numba.tiles_to_grid(lines)
+        return int(_connectivity_numba.flood_fill_reachable(grid, height, width, start[0], start[1]))
+    except Exception:
+        _use_numba = False
+        return None
+
 
 def check_map_connectivity(tiles: str, width: int, height: int) -> bool:
     """
@@ -41,13 +64,21 @@ def check_map_connectivity(tiles: str, width: int, height: int) -> bool:
     if not start:
         return False  # No accessible tiles
     
+    # Count total accessible tiles (floors + doors)
+    total_accessible = sum(line.count('.') + line.count('+') for line in lines)
+    
+    # Use the compiled flood fill when numba is installed and loads
+    reachable = _compiled_reachable(lines, width, height, start)
+    if reachable is not None:
+        return reachable == total_accessible
+    
     # BFS to find all reachable accessible tiles
     visited: Set[Tuple[int, int]] = set()
-    queue = [start]
+    queue = deque([start])
     visited.add(start)
     
     while queue:
-        x, y = queue.pop(0)
+        x, y = queue.popleft()
         
         # Check all 4 directions
         for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
@@ -57,8 +88,6 @@ def check_map_connectivity(tiles: str, width: int, height: int) -> bool:
                 visited.add((nx, ny))
                 queue.append((nx, ny))
     
-    # Count total accessible tiles (floors + doors)
-    total_accessible = sum(line.count('.') + line.count('+') for line in lines)
     return len(visited) == total_accessible
 
 
@@ -92,6 +121,12 @@ def count_reachable_tiles(tiles: str, width: int, height: int) -> int:
     if not start:
         return 0
     
+    # Same compiled flood fill as check_map_connectivity (needs a rectangular grid)
+    if all(len(line) == width for line in lines):
+        reachable = _compiled_reachable(lines, width, height, start)
+        if reachable is not None:
+            return reachable
+    
     # Flood fill to count reachable tiles
     visited: Set[Tuple[int, int]] = set()
     stack = [start]
@@ -1,16 +1,76 @@
 import json
 import os
+import threading
+import time
 import requests
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from .utils import load_secrets
 
 
+# Shared keep-alive session for Ollama HTTP calls (probe, generation, verification)
+HTTP_SESSION = requests.Session()
+_worker_sessions = threading.local()
+
+# Seconds an Ollama request may take when it is the only one in flight
+OLLAMA_TIMEOUT = 60
+# Seconds to wait for an Anthropic Message Batch before cancelling it
+ANTHROPIC_BATCH_MAX_WAIT = 3600
+
+
+def max_concurrency(config: Dict[str, Any], provider: str) -> int:
+    """Number of LLM requests to keep in flight for a provider.
+
+    A provider section's own "max_concurrency" wins. Otherwise Ollama runs
+    serially, since a stock server answers one request at a time
+    (OLLAMA_NUM_PARALLEL=1) and extra requests only queue behind it, and
+    remote providers use "llm.max_concurrency" (default 4).
+    """
+    configured = config.get(provider, {}).get("max_concurrency")
+    if configured is None:
+        configured = 1 if provider == "ollama" else config.get("llm", {}).get("max_concurrency", 4)
+    return max(1, int(configured))
+
+
+def thread_session() -> requests.Session:
+    """HTTP_SESSION on the main thread, a keep-alive session of its own on any other.
+
+    requests.Session is not documented as thread-safe, so pool workers don't share one.
+    """
+    if threading.current_thread() is threading.main_thread():
+        return HTTP_SESSION
+    session = getattr(_worker_sessions, "session", None)
+    if session is None:
+        session = _worker_sessions.session = requests.Session()
+    return session
+
+
 class LLMClient(ABC):
+    # Requests the caller keeps in flight on this client at once; clients of
+    # servers that queue requests allow for the wait in their timeouts
+    parallel_requests = 1
+    # Whether query_batch goes to a provider batch endpoint rather than
+    # issuing one query per prompt
+    supports_batch = False
+
     @abstractmethod
     def query(self, prompt: str, system_prompt: str = "") -> str:
         pass
 
+    def query_batch(self, prompts: Dict[str, str], system_prompt: str = "") -> Dict[str, Union[str, Exception]]:
+        """Query several prompts keyed by id. Returns responses keyed by the same ids.
+
+        Providers with a native batch endpoint override this; the default
+        issues one query per prompt. A prompt that failed maps to its exception.
+        """
+        responses = {}
+        for custom_id, prompt in prompts.items():
+            try:
+                responses[custom_id] = self.query(prompt, system_prompt)
+            except Exception as e:
+                responses[custom_id] = e
+        return responses
+
     @staticmethod
     def create(provider: str, json_mode: bool = False, **config) -> 'LLMClient':
         if provider == "anthropic":
@@ -57,14 +117,72 @@ class AnthropicClient(LLMClient):
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}")
 
+    supports_batch = True
+
+    def query_batch(self, prompts: Dict[str, str], system_prompt: str = "",
+                    poll_interval: float = 5.0, max_poll_interval: float = 60.0,
+                    max_wait: float = ANTHROPIC_BATCH_MAX_WAIT) -> Dict[str, Union[str, Exception]]:
+        """Submit all prompts as one Message Batch and wait for it to finish.
+
+        A batch still running after max_wait seconds is cancelled and raises.
+        """
+        if not prompts:
+            return {}
+        # Message Batches lived under client.beta before becoming GA
+        batches = getattr(self.client.messages, "batches", None) or self.client.beta.messages.batches
+        requests_ = [
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": 4000,
+                    "temperature": self.temperature,
+                    "system": system_prompt if system_prompt else "You are a helpful assistant.",
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for custom_id, prompt in prompts.items()
+        ]
+        try:
+            batch = batches.create(requests=requests_)
+            # Poll with exponential backoff until the batch has ended
+            deadline = time.monotonic() + max_wait
+            delay = poll_interval
+            while batch.processing_status != "ended":
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    batches.cancel(batch.id)
+                    raise TimeoutError(f"batch {batch.id} did not end within {max_wait:.0f}s and was cancelled")
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, max_poll_interval)
+                batch = batches.retrieve(batch.id)
+
+            responses = {}
+            for entry in batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    responses[entry.custom_id] = entry.result.message.content[0].text
+                else:
+                    error = getattr(entry.result, "error", None)
+                    responses[entry.custom_id] = Exception(f"batch request {entry.result.type}: {error}" if error else f"batch request {entry.result.type}")
+            return responses
+        except Exception as e:
+            raise Exception(f"Anthropic batch API error: {str(e)}")
+
 
 class OllamaClient(LLMClient):
     def __init__(self, model: str, endpoint: str = "http://localhost:11434", 
-                 temperature: float = 0.3, json_mode: bool = False, **kwargs):
+                 temperature: float = 0.3, json_mode: bool = False,
+                 session: requests.Session = None, **kwargs):
         self.model = os.getenv("OLLAMA_MODEL", model)
         self.endpoint = os.getenv("OLLAMA_ENDPOINT", endpoint)
         self.temperature = temperature
         self.json_mode = json_mode
+        self._session = session
+
+    @property
+    def session(self) -> requests.Session:
+        """The injected session, else the calling thread's keep-alive session."""
+        return self._session or thread_session()
 
     def query(self, prompt: str, system_prompt: str = "") -> str:
         try:
@@ -81,7 +199,8 @@ class OllamaClient(LLMClient):
             if self.json_mode:
                 payload["format"] = "json"
             
-            response = requests.post(url, json=payload, timeout=60)
+            # Requests beyond the server's OLLAMA_NUM_PARALLEL slots wait in its queue
+            response = self.session.post(url, json=payload, timeout=OLLAMA_TIMEOUT * self.parallel_requests)
             response.raise_for_status()
             
             result = response.json()
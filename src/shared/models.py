@@ -1,5 +1,6 @@
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from enum import Enum
 
@@ -38,6 +39,12 @@ class MapData(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     generated_at: datetime = Field(default_factory=datetime.now)
 
+    @field_validator("tiles")
+    @classmethod
+    def _strip_tiles(cls, v: str) -> str:
+        # Normalize once so consumers can split rows without re-stripping
+        return v.strip()
+
 
 class GenerationResult(BaseModel):
     prompt_index: int
@@ -48,11 +55,14 @@ class GenerationResult(BaseModel):
     error_message: Optional[str] = None
 
 
-class VerificationResult(BaseModel):
+@dataclass(slots=True)
+class VerificationResult:
+    # Plain slotted dataclass: verification runs keep one per map in memory,
+    # so skip the per-instance __dict__. Serialize with dataclasses.asdict.
     test_id: str
     overall_score: float
     passed: bool
-    quantitative_checks: Dict[str, Any] = Field(default_factory=dict)
-    qualitative_checks: Dict[str, Any] = Field(default_factory=dict)
-    llm_response: Dict[str, Any] = Field(default_factory=dict)
     processing_time: float
+    quantitative_checks: Dict[str, Any] = field(default_factory=dict)
+    qualitative_checks: Dict[str, Any] = field(default_factory=dict)
+    llm_response: Dict[str, Any] = field(default_factory=dict)
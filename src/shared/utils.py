@@ -1,9 +1,30 @@
 import json
+import re
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
 from .models import MapData, TileType, EntityType
 
 
+# Double-quoted literals (JSON keys/values) are never rewritten by compress_prompt
+_PROMPT_FILLER_RE = re.compile(r'("(?:[^"\\\n]|\\.)*")|\b(?:please|kindly|could you|the|an|a)\b[ \t]*', re.IGNORECASE)
+# Line break before a bullet or numbered list item
+_PROMPT_LIST_ITEM_RE = re.compile(r'\n(?=(?:[-*•]|\d+\.)[ \t]+)')
+_PROMPT_SPACES_RE = re.compile(r'\s+')
+_PROMPT_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Map marker per entity type; on a shared tile the type declared first in EntityType wins
+_ENTITY_MARKERS = {
+    EntityType.PLAYER: "@",
+    EntityType.OGRE: "O",
+    EntityType.GOBLIN: "G",
+    EntityType.SHOP: "S",
+    EntityType.CHEST: "C",
+    EntityType.TOMB: "T",
+    EntityType.SPIRIT: "X",
+    EntityType.HUMAN: "H",
+}
+
+
 def load_config(config_file: str) -> Dict[str, Any]:
     """Load configuration from JSON file."""
     config_path = Path("config") / config_file
@@ -22,6 +43,31 @@ def load_secrets() -> Dict[str, str]:
         return {}
 
 
+def compress_prompt(text: str, level: str = "lite") -> str:
+    """Shrink an LLM prompt without changing its instructions.
+
+    "lite" only strips indentation and extra blank lines. "full" also drops
+    articles and politeness fillers outside quoted literals and re-wraps
+    each paragraph onto one line, keeping every bullet or numbered list item
+    on its own line so rule boundaries stay unambiguous.
+    """
+    if level not in ("lite", "full"):
+        raise ValueError(f"Unknown prompt compression level: {level}")
+
+    text = '\n'.join(line.strip() for line in text.strip().splitlines())
+    text = _PROMPT_BLANK_LINES_RE.sub('\n\n', text)
+    if level == "lite":
+        return text
+
+    text = _PROMPT_FILLER_RE.sub(lambda m: m.group(1) or '', text)
+    lines = (
+        _PROMPT_SPACES_RE.sub(' ', item).strip()
+        for paragraph in text.split('\n\n')
+        for item in _PROMPT_LIST_ITEM_RE.split(paragraph)
+    )
+    return '\n'.join(line for line in lines if line)
+
+
 def validate_map_dimensions(tiles: str, width: int, height: int) -> tuple[bool, list[str]]:
     """Check if map dimensions match expected width and height."""
     errors = []
@@ -47,46 +93,21 @@ def visualize_map(map_data: MapData) -> str:
     """Convert map to human-readable format with entity markers."""
     lines = map_data.tiles.strip().split('\n')
     
-    # Create entity position lookup
-    entity_positions = {}
-    for entity_type, entity_list in map_data.entities.items():
-        for entity in entity_list:
-            pos = (entity.x, entity.y)
-            if pos not in entity_positions:
-                entity_positions[pos] = []
-            entity_positions[pos].append(entity_type)
+    # Winning marker per occupied tile; later types are overwritten by earlier ones
+    markers: Dict[Tuple[int, int], str] = {}
+    for entity_type in reversed(EntityType):
+        for entity in map_data.entities.get(entity_type, ()):
+            markers[(entity.x, entity.y)] = _ENTITY_MARKERS[entity_type]
     
-    # Build visualization
-    result = []
-    result.append(f"Map Layout ({map_data.width}x{map_data.height}):")
+    # Patch only the occupied tiles instead of rebuilding every row char by char
+    for (x, y), marker in markers.items():
+        if 0 <= y < len(lines) and 0 <= x < len(lines[y]):
+            line = lines[y]
+            lines[y] = line[:x] + marker + line[x + 1:]
     
-    for y, line in enumerate(lines):
-        display_line = ""
-        for x, char in enumerate(line):
-            if (x, y) in entity_positions:
-                # Show entity marker instead of tile
-                entities = entity_positions[(x, y)]
-                if EntityType.PLAYER in entities:
-                    display_line += "@"
-                elif EntityType.OGRE in entities:
-                    display_line += "O"
-                elif EntityType.GOBLIN in entities:
-                    display_line += "G"
-                elif EntityType.SHOP in entities:
-                    display_line += "S"
-                elif EntityType.CHEST in entities:
-                    display_line += "C"
-                elif EntityType.TOMB in entities:
-                    display_line += "T"
-                elif EntityType.SPIRIT in entities:
-                    display_line += "X"
-                elif EntityType.HUMAN in entities:
-                    display_line += "H"
-                else:
-                    display_line += char
-            else:
-                display_line += char
-        result.append(display_line)
+    # Build visualization
+    result = [f"Map Layout ({map_data.width}x{map_data.height}):"]
+    result.extend(lines)
     
     # Add entity summary
     if map_data.entities:
@@ -1,10 +1,45 @@
+import functools
+import hashlib
 import json
+import math
+import os
 import time
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+try:
+    # Optional faster JSON decoder; raises a json.JSONDecodeError subclass
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping
 from ..shared.models import MapData, VerificationResult, EntityType, EntityData
-from ..shared.llm_client import LLMClient
+from ..shared.llm_client import LLMClient, max_concurrency
 from ..shared.utils import load_config, visualize_map, count_tiles, validate_map_dimensions, validate_map_connectivity
 
+# Tile characters used by the placement and border scans
+_WALL = '#'
+_WALKABLE_TILES = frozenset('.+')  # floor and door
+
+# Prompt keywords that imply an expected count for each entity type
+_ENTITY_KEYWORDS = {
+    "ogre": ("ogre", "ogres"),
+    "goblin": ("goblin", "goblins"),
+    "shop": ("shop", "store", "merchant"),
+    "chest": ("chest", "treasure"),
+    "tomb": ("tomb", "tombs"),
+    "spirit": ("spirit", "spirits", "ghost", "ghosts"),
+    "human": ("customer", "customers", "shopper", "shoppers", "patron", "patrons", "villager", "villagers"),
+}
+_KEYWORD_OWNERS = {keyword: entity_type for entity_type, keywords in _ENTITY_KEYWORDS.items() for keyword in keywords}
+_NUMBER_WORDS = {"one": 1, "a": 1, "an": 1, "two": 2, "three": 3}
+
+# Part of every verification cache key; bump it whenever the checks or the
+# scoring change so verdicts cached by an older verifier are not reused
+VERIFIER_VERSION = "1"
+# Environment variables LLMClient reads over the config; they change the
+# verdict's model/endpoint, so they are part of the cache key too
+_LLM_ENV_OVERRIDES = ("OLLAMA_ENDPOINT", "OLLAMA_MODEL")
+
 
 class MapVerifier:
     """
@@ -28,31 +63,135 @@ class MapVerifier:
         
         # Get the config for the specified provider
         llm_config = self.config.get(provider, {})
+        self.provider = provider
+        self.llm_config = llm_config
         
         # Create the LLM client
         self.llm = LLMClient.create(provider, **llm_config)
 
-    def verify_maps(self, test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Verify multiple map-prompt pairs."""
-        results = []
-        total_time = 0
-        
-        for test_case in test_cases:
-            start_time = time.time()
-            result = self._verify_single_map(test_case)
-            processing_time = time.time() - start_time
+    def cache_key(self, test_case: Dict[str, Any]) -> str:
+        """Hash of everything a verdict depends on: prompt, map, verifier version, settings and env overrides."""
+        map_data = test_case["map"]
+        if isinstance(map_data, MapData):
+            map_data = map_data.model_dump(mode="json")
+        model = getattr(self.llm, "model", None)
+        payload = json.dumps({
+            "version": VERIFIER_VERSION,
+            "prompt": test_case["prompt"],
+            "map": map_data,
+            "provider": self.provider,
+            "llm": self.llm_config,
+            "model": model if isinstance(model, str) else None,
+            "verification": self.config.get("verification", {}),
+            "env": {name: os.getenv(name) for name in _LLM_ENV_OVERRIDES},
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def verify_maps(self, test_cases: List[Dict[str, Any]], max_workers: int = None) -> Dict[str, Any]:
+        """Verify multiple map-prompt pairs.
+        
+        Maps are verified on a thread pool of max_workers (default: the
+        provider's max_concurrency, see llm_client.max_concurrency); the time
+        goes to LLM round trips, so several verdicts can be in flight at once.
+        A local Ollama server needs a matching OLLAMA_NUM_PARALLEL to actually
+        answer them in parallel.
+        """
+        if max_workers is None:
+            max_workers = max_concurrency(self.config, self.provider)
+        max_workers = max(1, max_workers)
+        self.llm.parallel_requests = max_workers
+        if max_workers == 1:
+            results = [self._timed_verify_single_map(test_case) for test_case in test_cases]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(self._timed_verify_single_map, test_cases))
+        
+        return self.summarize_results(results)
+
+    def _timed_verify_single_map(self, test_case: Dict[str, Any]) -> VerificationResult:
+        """Verify one map and record its wall-clock processing time."""
+        start_time = time.perf_counter()
+        result = self._verify_single_map(test_case)
+        result.processing_time = time.perf_counter() - start_time
+        return result
+
+    def verify_maps_batch(self, test_cases: List[Dict[str, Any]], mode: str = "sync",
+                          max_workers: int = None) -> Dict[str, Any]:
+        """Verify multiple map-prompt pairs, optionally through the provider's batch endpoint.
+        
+        In "sync" mode this is verify_maps. In "batch" mode all quantitative checks
+        run locally first, then every map that still needs an LLM verdict is sent
+        in a single LLMClient.query_batch call and the responses are joined back
+        by request id. Each batched map is charged an equal share of the batch time.
+        Providers without a batch endpoint (LLMClient.supports_batch) fall back to
+        verify_maps, which keeps several requests in flight instead of one.
+        """
+        if mode not in ("sync", "batch"):
+            raise ValueError(f"Unknown verification mode: {mode}")
+        if mode == "sync" or not getattr(self.llm, "supports_batch", False):
+            return self.verify_maps(test_cases, max_workers)
+        
+        results: List[VerificationResult] = [None] * len(test_cases)
+        times = [0.0] * len(test_cases)
+        pending: Dict[str, tuple[int, Dict[str, Any]]] = {}
+        prompts: Dict[str, str] = {}
+        
+        # Local quantitative checks for every map
+        for index, test_case in enumerate(test_cases):
+            start_time = time.perf_counter()
+            try:
+                state = self._prepare_verification(test_case)
+                if state["qualitative"] is None:
+                    custom_id = f"map_{index:05d}"
+                    pending[custom_id] = (index, state)
+                    prompts[custom_id] = self._build_verification_prompt(
+                        state["prompt"], visualize_map(state["map_data"])
+                    )
+                else:
+                    results[index] = self._finalize_verification(state, *state["qualitative"])
+            except Exception as e:
+                results[index] = self._error_result(test_case, e)
+            times[index] = time.perf_counter() - start_time
+        
+        # One batched LLM request for the remaining maps
+        if pending:
+            start_time = time.perf_counter()
+            batch_error = None
+            try:
+                responses = self.llm.query_batch(prompts)
+            except Exception as e:
+                responses = {}
+                batch_error = str(e)
+            batch_share = (time.perf_counter() - start_time) / len(pending)
+            
+            for custom_id, (index, state) in pending.items():
+                response = responses.get(custom_id)
+                if isinstance(response, str):
+                    qualitative = self._qualitative_from_response(response)
+                else:
+                    error = batch_error or (str(response) if response is not None else "No batch result returned for this map")
+                    qualitative = (5.0, {"error": error}, {"error": error})
+                results[index] = self._finalize_verification(state, *qualitative)
+                times[index] += batch_share
+        
+        for result, processing_time in zip(results, times):
             result.processing_time = processing_time
-            total_time += processing_time
-            results.append(result)
         
+        return self.summarize_results(results)
+
+    def summarize_results(self, results: List[VerificationResult]) -> Dict[str, Any]:
+        """Build the results/summary payload for a verification run.
+        
+        Also used by the verify command to summarize fresh and cached verdicts together.
+        """
         # Calculate summary statistics
         passed = len([r for r in results if r.passed])
         average_score = sum(r.overall_score for r in results) / len(results) if results else 0
         
         summary = {
-            "total_tests": len(test_cases),
+            "total_tests": len(results),
             "passed": passed,
-            "failed": len(test_cases) - passed,
+            "failed": len(results) - passed,
             "average_score": average_score,
             "common_failures": self._identify_common_failures(results)
         }
@@ -65,128 +204,161 @@ class MapVerifier:
     def _verify_single_map(self, test_case: Dict[str, Any]) -> VerificationResult:
         """Verify a single map against its prompt."""
         try:
-            prompt = test_case["prompt"]
-            map_data = test_case["map"]
-            test_id = test_case.get("test_id", "unknown")
+            state = self._prepare_verification(test_case)
+            qualitative = state["qualitative"]
+            if qualitative is None:
+                qualitative = self._qualitative_verification(state["prompt"], state["map_data"])
+            return self._finalize_verification(state, *qualitative)
             
-            # Convert dict to MapData if needed, gracefully handling unknown entity keys
-            unknown_entities: list[str] = []
-            if isinstance(map_data, dict):
-                try:
-                    map_data = MapData(**map_data)
-                except Exception:
-                    md = dict(map_data)
-                    entities_in = md.get("entities", {}) or {}
-                    entities_out: Dict[EntityType, List[EntityData]] = {}
-                    for key, items in entities_in.items():
+        except Exception as e:
+            return self._error_result(test_case, e)
+
+    def _prepare_verification(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """Run all local checks for a test case.
+        
+        The returned state has "qualitative" set to a (score, details, llm_response)
+        tuple when the LLM verdict is skipped, or None when it is still needed.
+        """
+        prompt = test_case["prompt"]
+        map_data = test_case["map"]
+        test_id = test_case.get("test_id", "unknown")
+        
+        # Convert dict to MapData if needed, gracefully handling unknown entity keys
+        unknown_entities: list[str] = []
+        if isinstance(map_data, dict):
+            try:
+                map_data = MapData(**map_data)
+            except Exception:
+                md = dict(map_data)
+                entities_in = md.get("entities", {}) or {}
+                entities_out: Dict[EntityType, List[EntityData]] = {}
+                for key, items in entities_in.items():
+                    try:
+                        et = EntityType(key)
+                    except Exception:
+                        unknown_entities.append(str(key))
+                        continue
+                    lst: List[EntityData] = []
+                    for it in items or []:
                         try:
-                            et = EntityType(key)
+                            lst.append(EntityData(**it))
                         except Exception:
-                            unknown_entities.append(str(key))
                             continue
-                        lst: List[EntityData] = []
-                        for it in items or []:
-                            try:
-                                lst.append(EntityData(**it))
-                            except Exception:
-                                continue
-                        if lst:
-                            entities_out[et] = lst
-                    md["entities"] = entities_out
-                    meta = md.get("metadata", {}) or {}
-                    if unknown_entities:
-                        meta["unknown_entities"] = sorted(set(unknown_entities))
-                    md["metadata"] = meta
-                    map_data = MapData(**md)
-            
-            # First check for critical dimension errors - these are automatic failures
-            dimension_valid, dimension_errors = self._check_dimensions(map_data)
-            
-            # Perform quantitative checks
-            quantitative_score, quantitative_details = self._quantitative_verification(
-                prompt, map_data
-            )
-            # Surface unknown entities from metadata or coercion
-            try:
-                ue = list(map_data.metadata.get("unknown_entities", [])) if map_data.metadata else []
+                    if lst:
+                        entities_out[et] = lst
+                md["entities"] = entities_out
+                meta = md.get("metadata", {}) or {}
                 if unknown_entities:
-                    ue = sorted(set(ue + unknown_entities))
-                if ue:
-                    quantitative_details["unknown_entities"] = {
-                        "count": len(ue),
-                        "values": ue
-                    }
-            except Exception:
-                pass
-            
-            # Add dimension errors to quantitative details
-            if dimension_errors:
-                quantitative_details["dimension_errors"] = {
-                    "passed": False,
-                    "errors": dimension_errors
-                }
-            else:
-                quantitative_details["dimension_errors"] = {
-                    "passed": True,
-                    "errors": []
+                    meta["unknown_entities"] = sorted(set(unknown_entities))
+                md["metadata"] = meta
+                map_data = MapData(**md)
+        elif any(not isinstance(key, EntityType) for key in map_data.entities):
+            # Key entities by EntityType so lookups never need a string fallback
+            map_data.entities = {EntityType(key): items for key, items in map_data.entities.items()}
+        
+        # First check for critical dimension errors - these are automatic failures
+        dimension_valid, dimension_errors = self._check_dimensions(map_data)
+        
+        # Perform quantitative checks
+        quantitative_score, quantitative_details = self._quantitative_verification(
+            prompt, map_data
+        )
+        # Surface unknown entities from metadata or coercion
+        try:
+            ue = list(map_data.metadata.get("unknown_entities", [])) if map_data.metadata else []
+            if unknown_entities:
+                ue = sorted(set(ue + unknown_entities))
+            if ue:
+                quantitative_details["unknown_entities"] = {
+                    "count": len(ue),
+                    "values": ue
                 }
-            
-            # Perform qualitative checks using LLM (only if dimensions are valid)
-            if dimension_valid:
-                qualitative_score, qualitative_details, llm_response = self._qualitative_verification(
-                    prompt, map_data
-                )
-            else:
-                # Skip expensive LLM verification for maps with dimension errors
-                qualitative_score = 0.0
-                qualitative_details = {"skipped": "Dimension errors prevent qualitative analysis"}
-                llm_response = {"error": "Map has dimension errors, skipping LLM verification"}
-            
-            # Calculate overall score
-            q_weight = self.config["verification"]["quantitative_weight"]
-            ql_weight = self.config["verification"]["qualitative_weight"]
-            overall_score = (quantitative_score * q_weight + qualitative_score * ql_weight)
-            
-            # CRITICAL: Maps with dimension errors automatically fail regardless of score
-            if not dimension_valid:
-                overall_score = 0.0
-                passed = False
-            else:
-                # Check for critical entity failures (like missing player)
-                critical_entity_failures = any(
-                    check.get("critical", False) and not check.get("passed", True)
-                    for check in quantitative_details.get("entity_counts", {}).values()
-                )
-                # Also treat entity overlaps as critical failures
-                overlap_failed = not quantitative_details.get("entity_placement", {}).get("entity_overlap", {}).get("passed", True)
-                
-                if critical_entity_failures or overlap_failed:
-                    overall_score = 0.0
-                    passed = False
-                else:
-                    # Determine if passed (simple threshold for dimensionally valid maps)
-                    passed = overall_score >= 6.0
-            
-            return VerificationResult(
-                test_id=test_id,
-                overall_score=overall_score,
-                passed=passed,
-                quantitative_checks=quantitative_details,
-                qualitative_checks=qualitative_details,
-                llm_response=llm_response,
-                processing_time=0  # Will be set by caller
-            )
-            
-        except Exception as e:
-            return VerificationResult(
-                test_id=test_case.get("test_id", "unknown"),
-                overall_score=0.0,
-                passed=False,
-                quantitative_checks={"error": str(e)},
-                qualitative_checks={"error": str(e)},
-                llm_response={"error": str(e)},
-                processing_time=0
+        except Exception:
+            pass
+        
+        # Add dimension errors to quantitative details
+        if dimension_errors:
+            quantitative_details["dimension_errors"] = {
+                "passed": False,
+                "errors": dimension_errors
+            }
+        else:
+            quantitative_details["dimension_errors"] = {
+                "passed": True,
+                "errors": []
+            }
+        
+        # Check for critical entity failures (like missing player)
+        critical_entity_failures = any(
+            check.get("critical", False) and not check.get("passed", True)
+            for check in quantitative_details.get("entity_counts", {}).values()
+        )
+        # Also treat entity overlaps as critical failures
+        overlap_failed = not quantitative_details.get("entity_placement", {}).get("entity_overlap", {}).get("passed", True)
+        
+        # Perform qualitative checks using LLM (only if the map can still pass)
+        if not dimension_valid:
+            # Skip expensive LLM verification for maps with dimension errors
+            qualitative = (
+                0.0,
+                {"skipped": "Dimension errors prevent qualitative analysis"},
+                {"error": "Map has dimension errors, skipping LLM verification"},
             )
+        elif critical_entity_failures or overlap_failed:
+            # The map fails regardless of the LLM verdict, so don't query it
+            qualitative = (0.0, {"skipped": "Critical quantitative failure"}, {"skipped": True})
+        else:
+            qualitative = None
+        
+        return {
+            "test_id": test_id,
+            "prompt": prompt,
+            "map_data": map_data,
+            "quantitative_score": quantitative_score,
+            "quantitative_details": quantitative_details,
+            "auto_fail": not dimension_valid or critical_entity_failures or overlap_failed,
+            "qualitative": qualitative,
+        }
+
+    def _finalize_verification(self, state: Dict[str, Any], qualitative_score: float,
+                               qualitative_details: Dict[str, Any],
+                               llm_response: Dict[str, Any]) -> VerificationResult:
+        """Combine local checks and the qualitative verdict into a result."""
+        # Calculate overall score
+        q_weight = self.config["verification"]["quantitative_weight"]
+        ql_weight = self.config["verification"]["qualitative_weight"]
+        overall_score = (state["quantitative_score"] * q_weight + qualitative_score * ql_weight)
+        
+        # CRITICAL: Maps with dimension errors, missing critical entities or
+        # overlapping entities automatically fail regardless of score
+        if state["auto_fail"]:
+            overall_score = 0.0
+            passed = False
+        else:
+            # Determine if passed (simple threshold for dimensionally valid maps)
+            passed = overall_score >= 6.0
+        
+        return VerificationResult(
+            test_id=state["test_id"],
+            overall_score=overall_score,
+            passed=passed,
+            quantitative_checks=state["quantitative_details"],
+            qualitative_checks=qualitative_details,
+            llm_response=llm_response,
+            processing_time=0  # Will be set by caller
+        )
+
+    def _error_result(self, test_case: Dict[str, Any], e: Exception) -> VerificationResult:
+        """Build a failed result for a test case that raised during verification."""
+        return VerificationResult(
+            test_id=test_case.get("test_id", "unknown"),
+            overall_score=0.0,
+            passed=False,
+            quantitative_checks={"error": str(e)},
+            qualitative_checks={"error": str(e)},
+            llm_response={"error": str(e)},
+            processing_time=0
+        )
 
     def _quantitative_verification(self, prompt: str, map_data: MapData) -> tuple[float, Dict[str, Any]]:
         """Perform rule-based quantitative verification."""
@@ -212,7 +384,8 @@ class MapVerifier:
         # Map structure checks
         structure_score, structure_details = self._check_map_structure(prompt, map_data)
         details["structure"] = structure_details
-        score = min(score, score * (structure_score / 10.0))
+        # Sub-scores act as capped multipliers: they can only lower the score
+        score *= min(1.0, structure_score / 10.0)
         
         # Independent connectivity check - never trust generator metadata
         connectivity_verified = self._check_map_connectivity(map_data)
@@ -225,12 +398,13 @@ class MapVerifier:
         # Independent entity placement verification
         entity_placement_score, entity_placement_details = self._check_entity_placement(map_data)
         details["entity_placement"] = entity_placement_details
-        score = min(score, score * (entity_placement_score / 10.0))
         
         # Independent map border verification
         border_score, border_details = self._check_map_borders(map_data)
         details["map_borders"] = border_details
-        score = min(score, score * (border_score / 10.0))
+        
+        ratios = (entity_placement_score / 10.0, border_score / 10.0)
+        score *= math.prod(min(1.0, r) for r in ratios)
         
         return max(0.0, score), details
 
@@ -246,6 +420,14 @@ class MapVerifier:
             # Query local LLM
             response = self.llm.query(verification_prompt)
             
+        except Exception as e:
+            return 5.0, {"error": str(e)}, {"error": str(e)}
+        
+        return self._qualitative_from_response(response)
+
+    def _qualitative_from_response(self, response: str) -> tuple[float, Dict[str, Any], Dict[str, Any]]:
+        """Turn a raw LLM verification response into (score, details, llm_data)."""
+        try:
             # Parse response
             llm_data = self._parse_verification_response(response)
             
@@ -268,72 +450,58 @@ class MapVerifier:
         """Check if map has correct dimensions. Returns (is_valid, error_list)."""
         return validate_map_dimensions(map_data.tiles, map_data.width, map_data.height)
 
-    def _check_entity_counts(self, prompt: str, map_data: MapData) -> Dict[str, Any]:
-        """Check if entity counts match prompt requirements."""
-        checks = {}
-        
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _expected_counts_from_prompt(prompt: str) -> Mapping[str, int]:
+        """Extract expected entity counts from a prompt. Cached per prompt string."""
         # Simple keyword matching for entity counts
         prompt_lower = prompt.lower()
-        
-        # Check for specific entity mentions
-        entity_keywords = {
-            "ogre": ["ogre", "ogres"],
-            "goblin": ["goblin", "goblins"], 
-            "shop": ["shop", "store", "merchant"],
-            "chest": ["chest", "treasure"],
-            "tomb": ["tomb", "tombs"],
-            "spirit": ["spirit", "spirits", "ghost", "ghosts"],
-            "human": ["customer", "customers", "shopper", "shoppers", "patron", "patrons", "villager", "villagers"],
-        }
-        
-        def _count_entities(mt: MapData, et: EntityType) -> int:
-            # Accept both Enum and string keys for robustness
-            return len(
-                mt.entities.get(et, []) or mt.entities.get(et.value, [])
-            )
-
-        for entity_type, keywords in entity_keywords.items():
-            enum_key = EntityType(entity_type) if entity_type in EntityType.__members__.values() else None
-            # If above check doesn't work due to Enum API, construct directly
-            try:
-                enum_key = EntityType(entity_type)
-            except Exception:
-                enum_key = None
-            actual_count = _count_entities(map_data, enum_key or EntityType(entity_type))
-            
-            # Extract expected count from prompt
+        expected: Dict[str, int] = {}
+        
+        # Keywords match as substrings (plurals, punctuation), so test each one
+        # against the whole prompt once and only scan the types that appear
+        present = {owner for keyword, owner in _KEYWORD_OWNERS.items() if keyword in prompt_lower}
+        if not present:
+            return MappingProxyType(expected)
+        words = prompt_lower.split()
+        
+        for entity_type, keywords in _ENTITY_KEYWORDS.items():
+            if entity_type not in present:
+                continue
             expected_count = 0
             for keyword in keywords:
-                if keyword in prompt_lower:
-                    # Look for numbers before the keyword
-                    words = prompt_lower.split()
-                    for i, word in enumerate(words):
-                        if keyword in word:
-                            # Check previous words for numbers
-                            for j in range(max(0, i-3), i):
-                                try:
-                                    number_word = words[j]
-                                    if number_word.isdigit():
-                                        expected_count = max(expected_count, int(number_word))
-                                    elif number_word in ["one", "a", "an"]:
-                                        expected_count = max(expected_count, 1)
-                                    elif number_word == "two":
-                                        expected_count = max(expected_count, 2)
-                                    elif number_word == "three":
-                                        expected_count = max(expected_count, 3)
-                                except:
-                                    pass
-                            break
-            
+                if keyword not in prompt_lower:
+                    continue
+                # Look for numbers in the three words before the first mention
+                for i, word in enumerate(words):
+                    if keyword in word:
+                        for number_word in words[max(0, i-3):i]:
+                            if number_word.isdecimal():
+                                expected_count = max(expected_count, int(number_word))
+                            elif number_word in _NUMBER_WORDS:
+                                expected_count = max(expected_count, _NUMBER_WORDS[number_word])
+                        break
             if expected_count > 0:
-                checks[entity_type] = {
-                    "expected": expected_count,
-                    "actual": actual_count,
-                    "passed": actual_count == expected_count
-                }
+                expected[entity_type] = expected_count
+        
+        return MappingProxyType(expected)
+
+    def _check_entity_counts(self, prompt: str, map_data: MapData) -> Dict[str, Any]:
+        """Check if entity counts match prompt requirements."""
+        checks = {}
+        # Entities are keyed by EntityType (see _prepare_verification)
+        entities = map_data.entities
+        
+        for entity_type, expected_count in self._expected_counts_from_prompt(prompt).items():
+            actual_count = len(entities.get(EntityType(entity_type), ()))
+            checks[entity_type] = {
+                "expected": expected_count,
+                "actual": actual_count,
+                "passed": actual_count == expected_count
+            }
         
         # CRITICAL: Always check for player entity - maps without players are unplayable
-        player_count = _count_entities(map_data, EntityType.PLAYER)
+        player_count = len(entities.get(EntityType.PLAYER, ()))
         checks["player"] = {
             "expected": 1,
             "actual": player_count,
@@ -388,7 +556,7 @@ class MapVerifier:
         details = {}
         score = 10.0
         
-        lines = map_data.tiles.strip().split('\n')
+        lines = map_data.tiles.split('\n')
         
         # Check if entities are within map bounds and on valid tiles
         for entity_type, entity_list in map_data.entities.items():
@@ -412,7 +580,7 @@ class MapVerifier:
                 
                 # Check if entity is on a valid tile type
                 tile_char = lines[entity.y][entity.x]
-                if tile_char != '.' and tile_char != '+':  # Only allow floor or door tiles
+                if tile_char not in _WALKABLE_TILES:  # Only allow floor or door tiles
                     score -= 1.0
                     details[f"{entity_type.value}_tile_error"] = {
                         "passed": False, 
@@ -440,34 +608,34 @@ class MapVerifier:
         details = {}
         score = 10.0
         
-        lines = map_data.tiles.strip().split('\n')
+        lines = map_data.tiles.split('\n')
         
         # Check if map has borders (this is optional, so we don't fail if missing)
         has_borders = True
         
         # Check top border
-        if lines and not all(c == '#' for c in lines[0]):
+        if lines and not all(c == _WALL for c in lines[0]):
             has_borders = False
             details["top_border"] = {"passed": False, "message": "Top border is not solid walls"}
         else:
             details["top_border"] = {"passed": True, "message": "Top border is solid walls"}
         
         # Check bottom border
-        if lines and not all(c == '#' for c in lines[-1]):
+        if lines and not all(c == _WALL for c in lines[-1]):
             has_borders = False
             details["bottom_border"] = {"passed": False, "message": "Bottom border is not solid walls"}
         else:
             details["bottom_border"] = {"passed": True, "message": "Bottom border is solid walls"}
         
         # Check left border
-        if lines and not all(len(line) > 0 and line[0] == '#' for line in lines):
+        if lines and not all(len(line) > 0 and line[0] == _WALL for line in lines):
             has_borders = False
             details["left_border"] = {"passed": False, "message": "Left border is not solid walls"}
         else:
             details["left_border"] = {"passed": True, "message": "Left border is solid walls"}
         
         # Check right border
-        if lines and not all(len(line) > 0 and line[-1] == '#' for line in lines):
+        if lines and not all(len(line) > 0 and line[-1] == _WALL for line in lines):
             has_borders = False
             details["right_border"] = {"passed": False, "message": "Right border is not solid walls"}
         else:
@@ -505,23 +673,21 @@ Respond with JSON only:
 
     def _parse_verification_response(self, response: str) -> Dict[str, Any]:
         """Parse LLM verification response."""
-        try:
-            # Clean up response
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.endswith("```"):
-                response = response[:-3]
-            
-            return json.loads(response)
-        except json.JSONDecodeError:
-            # Fallback parsing for non-JSON responses
-            return {
-                "matches_request": "yes" in response.lower(),
-                "confidence": 5,
-                "positive_aspects": [],
-                "negative_aspects": ["Failed to parse LLM response"]
-            }
+        # Slice from the first '{' to the last '}' to drop code fences and chatter
+        start = response.find('{')
+        end = response.rfind('}')
+        if start >= 0 and end > start:
+            try:
+                return _json_loads(response[start:end + 1])
+            except json.JSONDecodeError:
+                pass
+        # Fallback parsing for non-JSON responses
+        return {
+            "matches_request": "yes" in response.lower(),
+            "confidence": 5,
+            "positive_aspects": [],
+            "negative_aspects": ["Failed to parse LLM response"]
+        }
 
     def _identify_common_failures(self, results: List[VerificationResult]) -> List[str]:
         """Identify common failure patterns across results."""
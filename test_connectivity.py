@@ -5,10 +5,11 @@ Test script for the shared connectivity module.
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add repository root to path; import through the src package like the app
+# does so numba's on-disk cache always sees the same module name
+sys.path.insert(0, str(Path(__file__).parent))
 
-from shared.connectivity import check_map_connectivity, count_reachable_tiles, get_connectivity_stats
+from src.shared.connectivity import check_map_connectivity, count_reachable_tiles, get_connectivity_stats
 
 def test_connectivity():
     """Test connectivity checking with various map layouts."""
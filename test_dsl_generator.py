@@ -7,10 +7,24 @@ and can be used to compare token efficiency against the tool-based approach.
 """
 
 import sys
+import io
 import json
 import time
 import argparse
-from src.generator.dsl_generator import DSLMapGenerator, DSLMapBuilder, DSLParser, CheckpointCommand
+import contextlib
+import traceback
+from src.generator.dsl_generator import DSLMapGenerator, DSLMapBuilder, DSLParser, CHECKPOINT_TYPES
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """Collect print() output in memory and write it to stdout in one call."""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 def test_parser():
     """Test the JSON DSL parser with various commands."""
@@ -35,13 +49,14 @@ def test_parser():
         '{"commands": [{"type": "checkpoint", "name": "complete", "full_verification": true}]}',
     ]
     
-    for program_json in test_programs:
-        try:
-            commands = parser.parse_program(program_json)
-            command = commands[0]
-            print(f"✅ {command.type} command -> {command.model_dump()}")
-        except Exception as e:
-            print(f"❌ {program_json[:50]}... -> Error: {e}")
+    with buffered_stdout():
+        for program_json in test_programs:
+            try:
+                commands = parser.parse_program(program_json)
+                command = commands[0]
+                print(f"✅ {command.type} command -> {command.model_dump()}")
+            except Exception as e:
+                print(f"❌ {program_json[:50]}... -> Error: {e}")
     
     print()
 
@@ -66,6 +81,7 @@ def test_builder():
   ]
 }'''
     
+    error = None
     try:
         parser = DSLParser()
         builder = DSLMapBuilder()
@@ -74,14 +90,15 @@ def test_builder():
         print(f"📝 Parsed {len(commands)} commands")
         
         checkpoint_count = 0
-        for i, command in enumerate(commands):
-            result = builder.execute_command(command)
-            
-            if isinstance(command, CheckpointCommand):
-                checkpoint_count += 1
-                print(f"\n{result}\n")
-            else:
-                print(f"Command {i}: {result}")
+        with buffered_stdout():
+            for i, command in enumerate(commands):
+                result = builder.execute_command(command)
+                
+                if type(command) in CHECKPOINT_TYPES:
+                    checkpoint_count += 1
+                    print(f"\n{result}\n")
+                else:
+                    print(f"Command {i}: {result}")
         
         print(f"🎯 Completed with {checkpoint_count} checkpoints")
         
@@ -91,9 +108,11 @@ def test_builder():
         
     except Exception as e:
         print(f"❌ Builder test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        # Snapshot the traceback now; source lines are only read when formatted
+        error = traceback.TracebackException.from_exception(e, lookup_lines=False)
     
+    if error is not None:
+        sys.stderr.writelines(error.format())
     print()
 
 def test_generator_mock():
@@ -119,19 +138,21 @@ def test_generator_mock():
   ]
 }'''
     
+    error = None
     try:
         commands = parser.parse_program(mock_dsl_program_json)
         checkpoint_outputs = []
         
         for command in commands:
             result = builder.execute_command(command)
-            if isinstance(command, CheckpointCommand):
+            if type(command) in CHECKPOINT_TYPES:
                 checkpoint_outputs.append(result)
         
-        print("Checkpoint outputs:")
-        for i, output in enumerate(checkpoint_outputs, 1):
-            print(f"\n--- Checkpoint {i} ---")
-            print(output)
+        with buffered_stdout():
+            print("Checkpoint outputs:")
+            for i, output in enumerate(checkpoint_outputs, 1):
+                print(f"\n--- Checkpoint {i} ---")
+                print(output)
         
         # Show final map data
         map_data = builder.to_map_data("mock_001", "treasure room with ogre guardian")
@@ -140,8 +161,10 @@ def test_generator_mock():
         
     except Exception as e:
         print(f"❌ Generator mock test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        error = traceback.TracebackException.from_exception(e, lookup_lines=False)
+    
+    if error is not None:
+        sys.stderr.writelines(error.format())
 
 def compare_token_efficiency():
     """Demonstrate token efficiency compared to tool-based approach."""
@@ -185,13 +208,22 @@ Checkpoint 2 - complete:
 Stats: connectivity ✅, entities ✅"""
     ]
     
-    # Rough token estimation (very approximate)
-    tool_tokens = sum(len(msg.split()) * 1.3 for msg in tool_based_messages)  # +30% for repetitive maps
-    dsl_tokens = sum(len(msg.split()) * 1.1 for msg in dsl_messages)  # +10% for structured output
+    try:
+        # Exact BPE counts when tiktoken and its encoding files are available
+        import tiktoken
+        enc = tiktoken.get_encoding("cl100k_base")
+        tool_tokens = sum(len(t) for t in enc.encode_batch(tool_based_messages))
+        dsl_tokens = sum(len(t) for t in enc.encode_batch(dsl_messages))
+        label = "Token usage (cl100k_base)"
+    except Exception:
+        # Rough token estimation (very approximate)
+        tool_tokens = sum(len(msg.split()) * 1.3 for msg in tool_based_messages)  # +30% for repetitive maps
+        dsl_tokens = sum(len(msg.split()) * 1.1 for msg in dsl_messages)  # +10% for structured output
+        label = "Estimated token usage"
     
     efficiency_gain = ((tool_tokens - dsl_tokens) / tool_tokens) * 100
     
-    print(f"📊 Estimated token usage:")
+    print(f"📊 {label}:")
     print(f"   Tool-based approach: ~{tool_tokens:.0f} tokens")
     print(f"   DSL approach: ~{dsl_tokens:.0f} tokens")
     print(f"   Efficiency gain: ~{efficiency_gain:.1f}% reduction")
@@ -227,9 +259,9 @@ if __name__ == "__main__":
             generator = DSLMapGenerator(provider=args.provider, verbose=args.verbose)
             prompts = ["a simple tavern with one ogre"]
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             results = generator.generate_maps(prompts)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             
             print(f"⏱️  Generation took {elapsed:.2f}s")
             print(f"📈 Results: {results['summary']}")
@@ -6,10 +6,12 @@ Run this to verify the local LLM integration works.
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add repository root to path; import through the src package like the app
+# does, so HTTP_SESSION is the session serial generation uses
+sys.path.insert(0, str(Path(__file__).parent))
 
-from generator.ollama_tool_generator import OllamaToolBasedGenerator
+from src.generator.ollama_tool_generator import OllamaToolBasedGenerator
+from src.shared.llm_client import HTTP_SESSION
 from rich.console import Console
 
 console = Console()
@@ -34,9 +36,19 @@ def test_ollama_generator():
         
         # Test simple map generation
         console.print("\n🎯 Testing map generation...")
-        test_prompt = "a small room with one ogre"
+        test_prompts = [
+            "a small room with one ogre",
+            "a tavern with a shop and two humans",
+            "two rooms connected by a corridor with a goblin",
+            "a crypt with a tomb and a spirit",
+            "a treasure room with a chest guarded by an ogre",
+            "a small village with three humans",
+            "a cave with a river and two goblins",
+            "a shrine with a spirit and a chest",
+        ]
         
-        result = generator.generate_maps([test_prompt])
+        # Multiple prompts run concurrently when ollama.max_concurrency > 1
+        result = generator.generate_maps(test_prompts)
         
         if result["summary"]["successful"] > 0:
             console.print("✅ Map generation successful!")
@@ -72,8 +84,7 @@ def check_ollama_status():
     console.print("\n🔍 Checking Ollama status...")
     
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        response = HTTP_SESSION.get("http://localhost:11434/api/tags", timeout=5)
         if response.status_code == 200:
             models = response.json().get("models", [])
             console.print("✅ Ollama is running and accessible")
@@ -1,46 +1,479 @@
 #!/usr/bin/env python3
 """
 Comprehensive test suite runner for the roguelike testing system.
-Runs generation, verification, and report generation in sequence.
+Runs generation, verification, and report generation as a small dependency
+graph, so independent stages (e.g. report asset rendering and verification)
+overlap.
 """
 import subprocess
 import sys
+import os
+import json
 import argparse
+import functools
+import hashlib
+import re
+import shutil
 from pathlib import Path
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 
-# Enable detailed logging to see what's happening during connectivity fixes
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    # Optional faster JSON decoder for the result files
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
+# Stages report progress from executor threads; keep their lines whole
+_print_lock = threading.Lock()
 
-def run_command(cmd, description):
-    """Run command with virtual environment activated."""
-    print(f"\n🔄 {description}...")
+# CLI processes still running, terminated if the suite is interrupted
+_children = set()
+
+# Interpreter of the project's virtual environment, relative to the repo root
+VENV_PYTHON = Path(".venv/bin/python")
+
+# Extra `generate` flags for each --generator choice
+GENERATOR_FLAGS = {
+    "default": [],
+    "ollama": ["--use-ollama-tools"],
+    "claude": ["--use-tools"],
+    "smart": ["--use-smart-positioning"],
+    "dsl": ["--use-dsl"],
+    "claude-dsl": ["--use-claude-dsl"],
+    "gemini-dsl": ["--use-gemini-dsl"],
+}
+
+# Everything generation output depends on besides the generate command line
+# (test_suite.py merges shard output); GENERATION_STAMP records their hash
+# plus the hash of the results file a successful generate stage wrote
+GENERATION_INPUTS = [
+    Path("tests/fixtures/prompts/test_suite.txt"),
+    Path("config/generator.json"),
+    Path(__file__).resolve(),
+]
+GENERATION_SOURCES = ["src/generator", "src/shared", "src/cli"]
+GENERATION_STAMP = Path("data/generated/.inputs_hash")
+
+# HTML report written by the report command
+REPORT_HTML = Path("data/report.html")
+
+# PDFs of previously converted reports, keyed by report HTML hash; the most
+# recently used PDF_CACHE_SIZE entries are kept
+PDF_CACHE_DIR = Path("data/.pdf_cache")
+PDF_CACHE_SIZE = 8
+# The report's "Generated on" stamp changes on every run; leave it out of the key
+_REPORT_STAMP_RE = re.compile(rb"Generated on \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+def _say(message):
+    with _print_lock:
+        print(message, flush=True)
+
+
+class CLIWorker:
+    """A single `python -m src.cli.worker` process reused for every CLI phase.
+
+    Saves the interpreter start-up and heavy imports that a fresh
+    `python -m src.cli.main` pays per phase. One command runs at a time;
+    submit() blocks until the previous command's wait() has returned.
+    """
+
+    def __init__(self, venv_python):
+        self.busy = threading.Lock()
+        env = dict(os.environ, PYTHONPATH=".")
+        self.proc = subprocess.Popen(
+            [str(venv_python), "-m", "src.cli.worker"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=env,
+        )
+        _children.add(self.proc)
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def submit(self, argv):
+        self.busy.acquire()
+        self.proc.stdin.write(json.dumps({"cmd": argv[0], "args": argv[1:]}) + "\n")
+        self.proc.stdin.flush()
+
+    def wait(self):
+        """Block until the submitted command finishes; returns its exit code."""
+        try:
+            line = self.proc.stdout.readline()
+            if not line:
+                return self.proc.wait() or 1  # Worker died mid-command
+            return json.loads(line)["returncode"]
+        finally:
+            self.busy.release()
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+        _children.discard(self.proc)
+
+
+class InProcessCLI:
+    """Runs CLI commands inside this interpreter, for when it already is the venv's.
+
+    Same interface as CLIWorker, minus the extra process: the command runs
+    in wait(), on the calling stage's thread, one at a time.
+    """
+
+    def __init__(self):
+        from src.cli.worker import run
+        self.run = run
+        self.busy = threading.Lock()
+        self.argv = None
+
+    def alive(self):
+        return True
+
+    def submit(self, argv):
+        self.busy.acquire()
+        self.argv = list(argv)
+
+    def wait(self):
+        try:
+            return self.run(self.argv[0], self.argv[1:])
+        finally:
+            self.busy.release()
+
+    def close(self):
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _have_venv():
+    """Whether VENV_PYTHON exists; checked once per main() run (it clears the cache)."""
+    return VENV_PYTHON.is_file()
+
+
+# Shared worker for the current main() run; None means one process per command
+_worker = None
+
+
+def start_command(argv, description, fresh=False):
+    """Launch a CLI command (an argument list, e.g. ["verify", "--example"])
+    with the virtual environment without waiting for it.
+
+    Runs on the shared worker when one is up, unless fresh=True asks for a
+    separate process (e.g. to overlap with a command already on the worker).
+    Returns a (process, start_time) handle for wait_command, or None if the
+    virtual environment is missing.
+    """
+    _say(f"\n🔄 {description}...")
     
-    venv_python = Path(".venv/bin/python")
-    if not venv_python.exists():
-        print("❌ Virtual environment not found. Run: uv venv && uv pip install ...")
-        return 1
+    if not _have_venv():
+        _say("❌ Virtual environment not found. Run: uv venv && uv pip install ...")
+        return None
     
-    full_cmd = f"PYTHONPATH=. {venv_python} -m src.cli.main {cmd}"
+    start_time = time.perf_counter()
+    if _worker is not None and _worker.alive() and not fresh:
+        _worker.submit(argv)
+        return _worker, start_time
+    
+    # Exec the interpreter directly with the argument list; nothing re-parses it
+    env = dict(os.environ, PYTHONPATH=".")
+    proc = subprocess.Popen([str(VENV_PYTHON), "-m", "src.cli.main", *argv], env=env)
+    _children.add(proc)
+    return proc, start_time
+
+
+def wait_command(handle, description):
+    """Wait for a command started by start_command and report its outcome."""
+    if handle is None:
+        return 1
     
-    start_time = time.time()
-    result = subprocess.call(full_cmd, shell=True)
-    duration = time.time() - start_time
+    proc, start_time = handle
+    result = proc.wait()
+    _children.discard(proc)
+    duration = time.perf_counter() - start_time
     
     if result == 0:
-        print(f"✅ {description} completed in {duration:.1f}s")
+        _say(f"✅ {description} completed in {duration:.1f}s")
     else:
-        print(f"❌ {description} failed")
+        _say(f"❌ {description} failed")
     
     return result
 
 
+def run_command(argv, description):
+    """Run command with virtual environment activated."""
+    return wait_command(start_command(argv, description), description)
+
+
+def run_stages(stages):
+    """Run a DAG of suite stages on a thread pool.
+
+    `stages` maps a name to (deps, fn); fn() returns an exit code and is
+    submitted as soon as every stage in deps (names not in `stages` are
+    ignored) has finished with 0. Stages behind a failed dependency are
+    skipped and reported as 1. Returns {name: exit code}.
+    """
+    results = {}
+    pending = dict(stages)
+    running = {}
+    pool = ThreadPoolExecutor(max_workers=max(len(stages), 1))
+    try:
+        while pending or running:
+            for name, (deps, fn) in list(pending.items()):
+                deps = [d for d in deps if d in stages]
+                if any(results.get(d, 0) != 0 for d in deps):
+                    results[name] = 1
+                    del pending[name]
+                elif all(d in results for d in deps):
+                    running[pool.submit(fn)] = name
+                    del pending[name]
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    except KeyboardInterrupt:
+        # Stop the CLI processes so the stage threads blocked on them return;
+        # a stage running in this process (InProcessCLI) can't be stopped, so
+        # don't wait for it either
+        for proc in list(_children):
+            proc.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
+    return results
+
+
+def run_generation_shards(argv, shards, output_dir="data/generated"):
+    """Run `argv --shard i/N` for every shard at once, then merge their results.
+
+    Each shard is its own CLI process (the shared worker runs one command at
+    a time). Shard result files are folded into generation_results.json with
+    the summary recomputed over all prompts. Returns an exit code.
+    """
+    handles = []
+    for i in range(shards):
+        description = f"Generating maps (shard {i + 1}/{shards})"
+        handles.append((start_command([*argv, "--shard", f"{i}/{shards}"], description, fresh=True), description))
+    if any(wait_command(handle, description) != 0 for handle, description in handles):
+        return 1
+    
+    output_path = Path(output_dir)
+    results = []
+    for i in range(shards):
+        shard_file = output_path / f"generation_results.shard{i}.json"
+        results += _json_loads(shard_file.read_bytes())["results"]
+        shard_file.unlink()
+    results.sort(key=lambda r: r["prompt_index"])
+    
+    successful = sum(1 for r in results if r["status"] == "success")
+    summary = {
+        "total_prompts": len(results),
+        "successful": successful,
+        "failed": len(results) - successful,
+        "average_time": sum(r["generation_time"] for r in results) / len(results) if results else 0,
+    }
+    with open(output_path / "generation_results.json", "w") as f:
+        json.dump({"results": results, "summary": summary}, f, indent=2)
+    with open(output_path / "summary.json", "w") as f:
+        json.dump({"summary": summary}, f, indent=2)
+    _say(f"✅ Merged {shards} generation shards ({successful}/{len(results)} successful)")
+    return 0
+
+
+def export_pdf(html_path, pdf_path):
+    """Save the HTML report as a PDF, reusing the PDF of an identical report.
+
+    Returns True if the PDF came from the cache instead of pdfkit.
+    """
+    key = hashlib.sha256(_REPORT_STAMP_RE.sub(b"", Path(html_path).read_bytes())).hexdigest()
+    cached = PDF_CACHE_DIR / f"{key}.pdf"
+    if cached.exists():
+        shutil.copyfile(cached, pdf_path)
+        os.utime(cached)  # Mark as recently used
+        return True
+    
+    import pdfkit
+    pdfkit.from_file(str(html_path), pdf_path)
+    PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(pdf_path, cached)
+    entries = sorted(PDF_CACHE_DIR.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[PDF_CACHE_SIZE:]:
+        stale.unlink()
+    return False
+
+
+# Closing summary, picked by the stages that ran (first match wins):
+# (stages required, completion banner, show report links, summary block)
+_SUMMARY_PLANS = [
+    ({"verify", "report"}, None, True, "verification"),
+    ({"generate", "verify"}, None, False, "quick"),
+    ({"generate"}, "✅ Generation completed successfully!", False, None),
+    ({"verify"}, "✅ Verification completed successfully!", True, "verification"),
+    ({"report"}, "✅ Report generation completed successfully!", True, None),
+]
+_RESULT_FILES = {
+    "gen": "data/generated/generation_results.json",
+    "ver": "data/verification/verification_results.json",
+}
+# Summary blocks: (title, summaries used, lines formatted with them, what failed to load)
+_SUMMARY_BLOCKS = {
+    "verification": ("📈 Verification Summary:", ("ver",), [
+        "Maps verified: {ver[total_tests]}",
+        "Maps passed: {ver[passed]}",
+        "Average score: {ver[average_score]:.1f}/10",
+    ], "verification summary"),
+    "quick": ("📈 Quick Summary:", ("gen", "ver"), [
+        "Maps generated: {gen[total_prompts]}",
+        "Average score: {ver[average_score]:.1f}/10",
+        "Maps passed: {ver[passed]}/{ver[total_tests]}",
+        "Average gen time: {gen[average_time]:.1f}s",
+    ], "summary"),
+}
+
+
+def _print_summary(ran, pdf_report_path=None):
+    """Print the closing summary for the set of stages that ran."""
+    banner, links, block = next(plan[1:] for plan in _SUMMARY_PLANS if plan[0] <= ran)
+    if banner:
+        print(f"\n{banner}")
+    if links:
+        print(f"📊 View results: {REPORT_HTML.absolute().as_uri()}")
+        if pdf_report_path:
+            print(f"📄 PDF report: {pdf_report_path.absolute()}")
+    if block is None:
+        return
+    
+    title, needs, lines, what = _SUMMARY_BLOCKS[block]
+    try:
+        summaries = {name: _load_summary(_RESULT_FILES[name]) for name in needs}
+        print(f"\n{title}")
+        for line in lines:
+            print("   • " + line.format(**summaries))
+    except Exception as e:
+        print(f"   (Could not load {what}: {e})")
+
+
+def _generation_inputs_hash(gen_argv):
+    """sha256 over the generate arguments, its input files, generator code and LLM env overrides."""
+    digest = hashlib.sha256("\0".join(gen_argv).encode())
+    sources = [path for folder in GENERATION_SOURCES for path in sorted(Path(folder).glob("*.py"))]
+    for path in GENERATION_INPUTS + sources:
+        digest.update(b"\0" + str(path).encode() + b"\0")
+        if path.exists():
+            digest.update(path.read_bytes())
+    for var in ("OLLAMA_ENDPOINT", "OLLAMA_MODEL"):
+        digest.update(b"\0" + os.environ.get(var, "").encode())
+    return digest.hexdigest()
+
+
+def _generation_stamp(gen_argv, results_file):
+    """Stamp text: inputs hash, then the hash of the results file (absent if missing)."""
+    inputs_hash = _generation_inputs_hash(gen_argv)
+    if not results_file.exists():
+        return inputs_hash
+    return f"{inputs_hash}\n{hashlib.sha256(results_file.read_bytes()).hexdigest()}"
+
+
+def run_generation(gen_argv, parallel=1, force=False):
+    """Run the generate stage unless its inputs match the last successful run.
+
+    The stamp also covers the results file, so output rewritten outside the
+    suite (e.g. a direct `generate` CLI run) is regenerated rather than reused.
+    """
+    results_file = GENERATION_STAMP.with_name("generation_results.json")
+    if (not force and results_file.exists() and GENERATION_STAMP.exists()
+            and GENERATION_STAMP.read_text() == _generation_stamp(gen_argv, results_file)):
+        _say("\n⏭  Generation inputs unchanged, reusing previous maps (--force to regenerate)")
+        return 0
+    
+    # A failed or interrupted run leaves no stamp, so it is never mistaken for current output
+    GENERATION_STAMP.unlink(missing_ok=True)
+    if parallel > 1:
+        result = run_generation_shards(gen_argv, parallel)
+    else:
+        result = run_command(gen_argv, "Generating maps from test suite")
+    if result == 0 and results_file.exists():
+        GENERATION_STAMP.write_text(_generation_stamp(gen_argv, results_file))
+    return result
+
+
+def _load_summary(path):
+    """Return the "summary" block of a generation/verification results file.
+
+    Reads the small summary.json the CLI writes beside the results when it
+    is at least as new, and only parses the full results file otherwise.
+    """
+    path = Path(path)
+    summary_file = path.with_name("summary.json")
+    try:
+        if summary_file.stat().st_mtime >= path.stat().st_mtime:
+            path = summary_file
+    except FileNotFoundError:
+        pass
+    return _json_loads(path.read_bytes())["summary"]
+
+
+def prewarm():
+    """Warm .pyc files and numba's kernel cache in a background process.
+
+    Returns the process (reap it with wait()) or None without a venv.
+    """
+    if not _have_venv():
+        return None
+    env = dict(os.environ, PYTHONPATH=".")
+    return subprocess.Popen([str(VENV_PYTHON), "-m", "src.cli.worker", "--prewarm"], env=env)
+
+
+def _prerender():
+    """Render report map images in their own process, beside the worker.
+
+    Failures are not fatal: the report step renders whatever is missing.
+    """
+    description = "Pre-rendering report assets"
+    wait_command(start_command(["prerender"], description, fresh=True), description)
+    return 0
+
+
+def _start_worker():
+    """Set up the shared CLI runner if the virtual environment exists.
+
+    Runs commands in this process when the suite itself was started with the
+    venv's interpreter, otherwise in a long-lived worker process.
+    """
+    global _worker
+    if not _have_venv():
+        return
+    if Path(sys.prefix).resolve() == VENV_PYTHON.parents[1].resolve():
+        _worker = InProcessCLI()
+    else:
+        _worker = CLIWorker(VENV_PYTHON)
+
+
+def _stop_worker():
+    global _worker
+    if _worker is not None:
+        _worker.close()
+        _worker = None
+
+
+def _shutdown(prewarm_proc, terminate=False):
+    """Stop the shared worker and reap every process the suite started.
+
+    CLI processes still running (after a failed stage) are terminated; the
+    prewarm process is waited on, or terminated first when terminate=True.
+    """
+    _stop_worker()
+    for proc in list(_children):
+        proc.terminate()
+        proc.wait()
+        _children.discard(proc)
+    if prewarm_proc is not None:
+        if terminate:
+            prewarm_proc.terminate()
+        prewarm_proc.wait()
+
+
 def main():
     """Run the complete test suite workflow."""
     parser = argparse.ArgumentParser(description="Roguelike Testing System")
@@ -51,7 +484,7 @@ def main():
     # Generator selection
     parser.add_argument(
         "--generator",
-        choices=["default", "ollama", "claude", "smart", "dsl", "claude-dsl", "gemini-dsl"],
+        choices=list(GENERATOR_FLAGS),
         default="dsl",
         help="Choose generator: default (config), ollama (Ollama tool-based), claude (Anthropic tool-based), smart (smart positioning), dsl (DSL-based), claude-dsl (DSL with Claude), gemini-dsl (DSL with Gemini)",
     )
@@ -76,8 +509,32 @@ def main():
         action="store_true",
         help="Show detailed LLM conversation and generation steps",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate maps even if the prompts, generator settings and code are unchanged",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run every CLI command in a fresh process instead of a shared worker/in-process",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Split generation into N prompt shards run as concurrent processes, and verify N maps at a time",
+    )
     args = parser.parse_args()
 
+    # Enable detailed logging to see what's happening during connectivity fixes
+    # (configured only once arguments parse, so --help skips it)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     pdf_report_path = None
     
     # If no specific steps are requested, run the complete suite
@@ -95,121 +552,76 @@ def main():
     
     print("=" * 50)
     
-    # Step 1: Generate maps from test suite
+    # Warm caches while the worker imports the CLI once for all phases;
+    # exiting closes the worker's stdin and stops it
+    _have_venv.cache_clear()
+    prewarm_proc = prewarm()
+    if not args.isolated:
+        _start_worker()
+    
+    # Stage graph: verify needs generation output, report needs verification.
+    # Map PNG rendering only needs generation output, so it runs beside
+    # verification instead of inside the report step.
+    stages = {}
     if args.generate:
         gen_flags = ["generate", "--example"]
         if args.visualize:
             gen_flags.append("--visualize")
         if args.verbose:
             gen_flags.append("--verbose")
-        if args.generator == "ollama":
-            gen_flags.append("--use-ollama-tools")
-        elif args.generator == "claude":
-            gen_flags.append("--use-tools")
-        elif args.generator == "smart":
-            gen_flags.append("--use-smart-positioning")
-        elif args.generator == "dsl":
-            gen_flags.append("--use-dsl")
-        elif args.generator == "claude-dsl":
-            gen_flags.append("--use-claude-dsl")
-        elif args.generator == "gemini-dsl":
-            gen_flags.append("--use-gemini-dsl")
+        gen_flags += GENERATOR_FLAGS[args.generator]
         if args.ollama_endpoint:
             gen_flags += ["--ollama-endpoint", args.ollama_endpoint]
-
-        if run_command(" ".join(gen_flags), "Generating maps from test suite") != 0:
-            sys.exit(1)
+        stages["generate"] = ([], lambda: run_generation(gen_flags, args.parallel, args.force))
     
-    # Step 2: Verify all generated maps
     if args.verify:
         ver_flags = ["verify", "--example"]
         if args.ollama_endpoint:
             ver_flags += ["--ollama-endpoint", args.ollama_endpoint]
         if args.verifier != "default":
             ver_flags += ["--verifier-provider", args.verifier]
-        if run_command(" ".join(ver_flags), "Verifying generated maps") != 0:
-            sys.exit(1)
+        if args.parallel > 1:
+            ver_flags += ["--workers", str(args.parallel)]
+        stages["verify"] = (["generate"], lambda: run_command(ver_flags, "Verifying generated maps"))
+        if args.report:
+            stages["prerender"] = (["generate"], _prerender)
     
-    # Step 3: Generate HTML report
     if args.report:
-        if run_command("report", "Generating HTML report") != 0:
+        stages["report"] = (["verify", "prerender"], lambda: run_command(["report"], "Generating HTML report"))
+    
+    # Stop the worker and reap background processes on every way out,
+    # including a failed stage
+    try:
+        results = run_stages(stages)
+        if any(rc != 0 for rc in results.values()):
             sys.exit(1)
-        if args.pdf:
+        
+        # PDF export of the finished report
+        if args.report and args.pdf:
             try:
-                import pdfkit
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 pdf_report_path = Path("data") / f"report_{timestamp}.pdf"
-                pdfkit.from_file("data/report.html", pdf_report_path)
-                print(f"📝 PDF report saved: {pdf_report_path}")
+                reused = export_pdf(REPORT_HTML, pdf_report_path)
+                print(f"📝 PDF report saved: {pdf_report_path}{' (unchanged report, reused cached PDF)' if reused else ''}")
             except Exception as e:
                 print(f"⚠️ Failed to create PDF report: {e}")
+    except KeyboardInterrupt:
+        _say("\n⛔ Test suite interrupted")
+        in_process = isinstance(_worker, InProcessCLI)
+        _shutdown(prewarm_proc, terminate=True)
+        if in_process:
+            # Interpreter shutdown joins executor threads, i.e. would wait for
+            # the in-process stage to finish; leave without running it
+            sys.stderr.flush()
+            os._exit(130)
+        sys.exit(130)
+    finally:
+        _shutdown(prewarm_proc)
     
     print("\n🎉 Test suite completed successfully!")
     
-    # Show appropriate summary based on what was run
-    if args.verify and args.report:
-        print(f"📊 View results: file://{Path('data/report.html').absolute()}")
-        if pdf_report_path:
-            print(f"📄 PDF report: {pdf_report_path.absolute()}")
-        
-        try:
-            import json
-            with open("data/verification/verification_results.json", 'r') as f:
-                ver_data = json.load(f)
-            
-            print("\n📈 Verification Summary:")
-            print(f"   • Maps verified: {ver_data['summary']['total_tests']}")
-            print(f"   • Maps passed: {ver_data['summary']['passed']}")
-            print(f"   • Average score: {ver_data['summary']['average_score']:.1f}/10")
-            
-        except Exception as e:
-            print(f"   (Could not load verification summary: {e})")
-    
-    elif args.generate and args.verify:
-        try:
-            import json
-            with open("data/generated/generation_results.json", 'r') as f:
-                gen_data = json.load(f)
-            with open("data/verification/verification_results.json", 'r') as f:
-                ver_data = json.load(f)
-            
-            print("\n📈 Quick Summary:")
-            print(f"   • Maps generated: {gen_data['summary']['total_prompts']}")
-            print(f"   • Average score: {ver_data['summary']['average_score']:.1f}/10")
-            print(f"   • Maps passed: {ver_data['summary']['passed']}/{ver_data['summary']['total_tests']}")
-            print(f"   • Average gen time: {gen_data['summary']['average_time']:.1f}s")
-            
-        except Exception as e:
-            print(f"   (Could not load summary: {e})")
-    
-    elif args.generate:
-        print("\n✅ Generation completed successfully!")
-    
-    elif args.verify:
-        print("\n✅ Verification completed successfully!")
-        print(f"📊 View results: file://{Path('data/report.html').absolute()}")
-        if pdf_report_path:
-            print(f"📄 PDF report: {pdf_report_path.absolute()}")
-        
-        try:
-            import json
-            with open("data/verification/verification_results.json", 'r') as f:
-                ver_data = json.load(f)
-            
-            print("\n📈 Verification Summary:")
-            print(f"   • Maps verified: {ver_data['summary']['total_tests']}")
-            print(f"   • Maps passed: {ver_data['summary']['passed']}")
-            print(f"   • Average score: {ver_data['summary']['average_score']:.1f}/10")
-            
-        except Exception as e:
-            print(f"   (Could not load verification summary: {e})")
-    
-    elif args.report:
-        print(f"\n✅ Report generation completed successfully!")
-        print(f"📊 View results: file://{Path('data/report.html').absolute()}")
-        if pdf_report_path:
-            print(f"📄 PDF report: {pdf_report_path.absolute()}")
-
+    ran = {stage for stage in ("generate", "verify", "report") if getattr(args, stage)}
+    _print_summary(ran, pdf_report_path)
 
 if __name__ == "__main__":
     main()
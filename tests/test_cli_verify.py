@@ -0,0 +1,75 @@
+import json
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+# Ensure repository root is on path for importing src
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from src.cli import main as cli
+from src.verifier.map_verifier import MapVerifier
+
+
+TILES = "\n".join([
+    "#####",
+    "#...#",
+    "#...#",
+    "#####",
+])
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.prompts = []
+
+    def query(self, prompt, system_prompt=""):
+        self.prompts.append(prompt)
+        return '{"matches_request": true, "confidence": 8}'
+
+
+def write_maps(directory, count):
+    prompts = []
+    for i in range(count):
+        prompt = f"a small room number {i}"
+        prompts.append(prompt)
+        (directory / f"map_{i:03d}.json").write_text(json.dumps({
+            "id": f"map_{i:03d}",
+            "prompt": prompt,
+            "width": 5,
+            "height": 4,
+            "tiles": TILES,
+            "entities": {"player": [{"x": 1, "y": 1}]},
+        }))
+    prompts_file = directory / "prompts.txt"
+    prompts_file.write_text("\n".join(prompts))
+    return prompts_file
+
+
+def test_verify_cache_keeps_most_recently_used_entries(monkeypatch, tmp_path):
+    monkeypatch.chdir(ROOT)
+    llm = RecordingLLM()
+
+    def make_verifier(provider=None):
+        verifier = MapVerifier(provider="ollama")
+        verifier.llm = llm
+        return verifier
+
+    monkeypatch.setattr(cli, "MapVerifier", make_verifier)
+    monkeypatch.setattr(cli, "VERIFY_CACHE_SIZE", 2)
+    maps_dir = tmp_path / "maps"
+    maps_dir.mkdir()
+    prompts_file = write_maps(maps_dir, 3)
+    output = tmp_path / "verification"
+    args = ["verify", "-m", str(maps_dir), "-p", str(prompts_file), "-o", str(output)]
+
+    result = CliRunner().invoke(cli.main, args)
+    assert result.exit_code == 0, result.output
+    assert len(list((output / ".cache").glob("*.json"))) == 2
+    assert len(llm.prompts) == 3
+
+    # Two maps come from the cache, the pruned one is verified again
+    result = CliRunner().invoke(cli.main, args)
+    assert result.exit_code == 0, result.output
+    assert len(llm.prompts) == 4
+    assert len(list((output / ".cache").glob("*.json"))) == 2
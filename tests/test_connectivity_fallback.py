@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+# Ensure repository root is on path for importing src
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from src.shared import connectivity
+
+
+def test_kernel_failure_falls_back_to_bfs(monkeypatch):
+    def broken_kernel(*args):
+        raise ModuleNotFoundError("No module named 'shared'")
+
+    monkeypatch.setattr(connectivity, "_use_numba", True)
+    monkeypatch.setattr(connectivity._connectivity_numba, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(connectivity._connectivity_numba, "tiles_to_grid", lambda lines: lines)
+    monkeypatch.setattr(connectivity._connectivity_numba, "flood_fill_reachable", broken_kernel, raising=False)
+
+    assert connectivity.check_map_connectivity("#..#\n####\n#..#", 4, 3) is False
+    assert connectivity._use_numba is False
+    assert connectivity.count_reachable_tiles("#..#\n#+.#", 4, 2) == 4
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure repository root is on path for importing src
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from src.generator.dsl_generator import DSLExecutionError, DSLParser, GridCommand, RoomCommand
+
+
+def test_commands_dispatch_on_type_tag():
+    commands = DSLParser().parse_program(
+        '{"commands": [{"type": "grid", "width": 20, "height": 15},'
+        ' {"type": "room", "name": "hall", "x": 1, "y": 1, "width": 5, "height": 4}]}'
+    )
+
+    assert [type(c) for c in commands] == [GridCommand, RoomCommand]
+
+
+def test_command_without_type_tag_is_rejected():
+    # Untagged commands used to fall through to the first union member whose
+    # defaults fit; the discriminated union requires an explicit "type"
+    with pytest.raises(DSLExecutionError, match="discriminator 'type'"):
+        DSLParser().parse_program('{"commands": [{"width": 20, "height": 15}]}')
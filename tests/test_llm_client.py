@@ -0,0 +1,70 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Ensure repository root is on path for importing src
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from src.shared import llm_client
+from src.shared.llm_client import HTTP_SESSION, max_concurrency, thread_session
+
+
+def test_max_concurrency_keeps_local_ollama_serial():
+    config = {"llm": {"max_concurrency": 4}, "ollama": {}}
+
+    assert max_concurrency(config, "ollama") == 1
+    assert max_concurrency(config, "anthropic") == 4
+    config["ollama"]["max_concurrency"] = 2
+    assert max_concurrency(config, "ollama") == 2
+
+
+def test_pool_workers_get_their_own_session():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        sessions = list(pool.map(lambda _: thread_session(), range(2)))
+
+    assert thread_session() is HTTP_SESSION
+    assert HTTP_SESSION not in sessions
+
+
+def test_ollama_timeout_allows_for_queued_requests():
+    class Response:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"response": "ok"}
+
+    class RecordingSession:
+        timeouts = []
+
+        def post(self, url, json, timeout):
+            self.timeouts.append(timeout)
+            return Response()
+
+    session = RecordingSession()
+    client = llm_client.OllamaClient(model="test", session=session)
+    client.parallel_requests = 3
+    client.query("prompt")
+
+    assert session.timeouts == [llm_client.OLLAMA_TIMEOUT * 3]
+
+
+def test_anthropic_batch_is_cancelled_after_max_wait(monkeypatch):
+    cancelled = []
+    batches = SimpleNamespace(
+        create=lambda requests: SimpleNamespace(id="b1", processing_status="in_progress"),
+        retrieve=lambda batch_id: SimpleNamespace(id=batch_id, processing_status="in_progress"),
+        cancel=cancelled.append,
+    )
+    client = object.__new__(llm_client.AnthropicClient)
+    client.client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    client.model, client.temperature = "test", 0.5
+    monkeypatch.setattr(llm_client.time, "sleep", lambda seconds: None)
+
+    with pytest.raises(Exception, match="did not end within"):
+        client.query_batch({"map_00000": "prompt"}, max_wait=0)
+
+    assert cancelled == ["b1"]
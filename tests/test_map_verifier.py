@@ -0,0 +1,183 @@
+import sys
+from pathlib import Path
+
+# Ensure repository root is on path for importing src
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from src.shared.models import EntityData, MapData
+from src.verifier import map_verifier
+from src.verifier.map_verifier import MapVerifier
+
+
+TILES = "\n".join([
+    "#####",
+    "#...#",
+    "#...#",
+    "#####",
+])
+
+
+class RecordingLLM:
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    def query(self, prompt, system_prompt=""):
+        self.prompts.append(prompt)
+        return self.response
+
+
+def make_verifier(monkeypatch, response='{"matches_request": true, "confidence": 8}'):
+    monkeypatch.chdir(ROOT)
+    verifier = MapVerifier(provider="ollama")
+    verifier.llm = RecordingLLM(response)
+    return verifier
+
+
+def make_case(entities):
+    return {
+        "test_id": "test_000",
+        "prompt": "a small room",
+        "map": {
+            "id": "map_000",
+            "prompt": "a small room",
+            "width": 5,
+            "height": 4,
+            "tiles": TILES,
+            "entities": entities,
+        },
+    }
+
+
+def test_llm_skipped_for_missing_player(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+
+    result = verifier._verify_single_map(make_case({}))
+
+    assert verifier.llm.prompts == []
+    assert result.passed is False
+    assert result.overall_score == 0.0
+    assert result.llm_response == {"skipped": True}
+
+
+def test_llm_queried_for_valid_map(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+
+    result = verifier._verify_single_map(make_case({"player": [{"x": 1, "y": 1}]}))
+
+    assert len(verifier.llm.prompts) == 1
+    assert result.passed is True
+    assert result.llm_response["confidence"] == 8
+
+
+def test_parse_verification_response_with_preamble(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+
+    parsed = verifier._parse_verification_response(
+        'Sure! Here is my review:\n```json\n{"matches_request": false, "confidence": 3}\n```\nThanks.'
+    )
+
+    assert parsed == {"matches_request": False, "confidence": 3}
+
+
+def test_parse_verification_response_fallback(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+
+    parsed = verifier._parse_verification_response("yes, {not json}")
+
+    assert parsed["matches_request"] is True
+    assert parsed["negative_aspects"] == ["Failed to parse LLM response"]
+
+
+def test_batch_mode_sends_one_batch(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+    batches = []
+
+    def fake_query_batch(prompts, system_prompt=""):
+        batches.append(prompts)
+        return {cid: '{"matches_request": true, "confidence": 9}' for cid in prompts}
+
+    verifier.llm.query_batch = fake_query_batch
+    verifier.llm.supports_batch = True
+    cases = [
+        make_case({"player": [{"x": 1, "y": 1}]}),
+        make_case({}),
+        make_case({"player": [{"x": 2, "y": 2}]}),
+    ]
+
+    output = verifier.verify_maps_batch(cases, mode="batch")
+
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+    assert verifier.llm.prompts == []
+    assert [r.passed for r in output["results"]] == [True, False, True]
+    assert output["results"][0].llm_response["confidence"] == 9
+    assert output["summary"]["passed"] == 2
+
+
+def test_string_entity_keys_are_normalized(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+    case = make_case({})
+    map_data = MapData(**case["map"])
+    map_data.entities = {"player": [EntityData(x=1, y=1)]}
+    case["map"] = map_data
+
+    result = verifier._verify_single_map(case)
+
+    assert result.quantitative_checks["entity_counts"]["player"]["actual"] == 1
+    assert result.passed is True
+
+
+def test_cache_key_tracks_map_and_verifier_version(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+    case = make_case({"player": [{"x": 1, "y": 1}]})
+    key = verifier.cache_key(case)
+
+    assert verifier.cache_key(make_case({"player": [{"x": 1, "y": 1}]})) == key
+    assert verifier.cache_key(make_case({"player": [{"x": 2, "y": 1}]})) != key
+    monkeypatch.setattr(map_verifier, "VERIFIER_VERSION", "test")
+    assert verifier.cache_key(case) != key
+
+
+def test_cache_key_tracks_ollama_env_overrides(monkeypatch):
+    monkeypatch.delenv("OLLAMA_ENDPOINT", raising=False)
+    verifier = make_verifier(monkeypatch)
+    case = make_case({"player": [{"x": 1, "y": 1}]})
+    key = verifier.cache_key(case)
+
+    monkeypatch.setenv("OLLAMA_ENDPOINT", "http://elsewhere:11434")
+    assert verifier.cache_key(case) != key
+
+
+def test_ollama_verifies_serially_by_default(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+    verifier.config["ollama"].pop("max_concurrency", None)
+    used = []
+    monkeypatch.setattr(map_verifier, "ThreadPoolExecutor", lambda max_workers: used.append(max_workers))
+
+    output = verifier.verify_maps([make_case({"player": [{"x": 1, "y": 1}]})] * 2)
+
+    assert used == []
+    assert output["summary"]["total_tests"] == 2
+    assert verifier.llm.parallel_requests == 1
+
+
+def test_batch_mode_reports_each_failed_request(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+    verifier.llm.supports_batch = True
+    verifier.llm.query_batch = lambda prompts, system_prompt="": {
+        cid: ConnectionError("connection refused") for cid in prompts
+    }
+
+    output = verifier.verify_maps_batch([make_case({"player": [{"x": 1, "y": 1}]})], mode="batch")
+
+    assert output["results"][0].llm_response == {"error": "connection refused"}
+
+
+def test_batch_mode_without_batch_endpoint_verifies_individually(monkeypatch):
+    verifier = make_verifier(monkeypatch)
+
+    output = verifier.verify_maps_batch([make_case({"player": [{"x": 1, "y": 1}]})] * 2, mode="batch")
+
+    assert len(verifier.llm.prompts) == 2
+    assert output["summary"]["passed"] == 2
@@ -20,6 +20,11 @@ def test_pdf_report_generation(monkeypatch, tmp_path):
         return 0
     monkeypatch.setattr(test_suite, "run_command", fake_run_command)
 
+    # Nothing in this flow should start a real CLI process
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError(f"unexpected subprocess: {args}")
+    monkeypatch.setattr(test_suite.subprocess, "Popen", no_subprocess)
+
     # Stub pdfkit with a simple implementation
     def fake_from_file(input_path, output_path):
         Path(output_path).write_text("PDF")
@@ -49,3 +54,24 @@ def test_pdf_report_generation(monkeypatch, tmp_path):
     assert len(names) == 2
     for p in pdf_files:
         assert p.read_text() == "PDF"
+
+
+def test_pdf_export_reuses_cached_pdf(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    html = tmp_path / "report.html"
+    conversions = []
+
+    def fake_from_file(input_path, output_path):
+        conversions.append(input_path)
+        Path(output_path).write_text("PDF")
+    monkeypatch.setitem(sys.modules, "pdfkit", types.SimpleNamespace(from_file=fake_from_file))
+
+    html.write_text("<p>Generated on 2024-01-01 00:00:00</p>")
+    assert test_suite.export_pdf(html, tmp_path / "a.pdf") is False
+    html.write_text("<p>Generated on 2024-01-01 00:00:05</p>")
+    assert test_suite.export_pdf(html, tmp_path / "b.pdf") is True
+    html.write_text("<p>Changed</p>")
+    assert test_suite.export_pdf(html, tmp_path / "c.pdf") is False
+
+    assert len(conversions) == 2
+    assert (tmp_path / "b.pdf").read_text() == "PDF"
@@ -0,0 +1,140 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Ensure repository root is on path for importing test_suite
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+import test_suite
+
+
+def test_run_stages_follows_dependencies():
+    order = []
+
+    def stage(name, rc=0):
+        def run():
+            order.append(name)
+            return rc
+        return run
+
+    results = test_suite.run_stages({
+        "generate": ([], stage("generate")),
+        "verify": (["generate"], stage("verify", rc=1)),
+        "report": (["verify", "missing"], stage("report")),
+    })
+
+    assert order == ["generate", "verify"]
+    assert results == {"generate": 0, "verify": 1, "report": 1}
+
+
+def test_run_stages_interrupt_does_not_wait_for_running_stage(monkeypatch):
+    release = threading.Event()
+    terminated = []
+
+    class FakeProc:
+        def terminate(self):
+            terminated.append(self)
+
+    proc = FakeProc()
+    monkeypatch.setattr(test_suite, "_children", {proc})
+
+    def interrupted_wait(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(test_suite, "wait", interrupted_wait)
+
+    # Stands in for a stage running in-process, which nothing can stop
+    start = time.perf_counter()
+    with pytest.raises(KeyboardInterrupt):
+        test_suite.run_stages({"verify": ([], lambda: release.wait(5) and 0)})
+    elapsed = time.perf_counter() - start
+    release.set()
+
+    assert elapsed < 1
+    assert terminated == [proc]
+
+
+def test_main_exits_130_on_interrupt(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    def interrupted(stages):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(test_suite, "run_stages", interrupted)
+    monkeypatch.setattr(sys, "argv", ["test_suite.py", "--report"])
+
+    with pytest.raises(SystemExit) as exc:
+        test_suite.main()
+
+    assert exc.value.code == 130
+
+
+def test_main_reaps_worker_and_children_when_a_stage_fails(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    events = []
+
+    class FakeProc:
+        def __init__(self, name):
+            self.name = name
+
+        def terminate(self):
+            events.append(f"terminate {self.name}")
+
+        def wait(self):
+            events.append(f"wait {self.name}")
+
+        def close(self):
+            events.append(f"close {self.name}")
+
+    def start_worker():
+        test_suite._worker = FakeProc("worker")
+
+    def failed_stage(stages):
+        test_suite._children.add(FakeProc("prerender"))
+        return {"verify": 1}
+
+    monkeypatch.setattr(test_suite, "_children", set())
+    monkeypatch.setattr(test_suite, "prewarm", lambda: FakeProc("prewarm"))
+    monkeypatch.setattr(test_suite, "_start_worker", start_worker)
+    monkeypatch.setattr(test_suite, "run_stages", failed_stage)
+    monkeypatch.setattr(sys, "argv", ["test_suite.py", "--report"])
+
+    with pytest.raises(SystemExit) as exc:
+        test_suite.main()
+
+    assert exc.value.code == 1
+    assert events == ["close worker", "terminate prerender", "wait prerender", "wait prewarm"]
+    assert test_suite._worker is None
+    assert not test_suite._children
+
+
+def test_generation_skipped_only_while_inputs_and_results_match(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    results = tmp_path / "data" / "generated" / "generation_results.json"
+    results.parent.mkdir(parents=True)
+    (tmp_path / "src" / "cli").mkdir(parents=True)
+    cli_main = tmp_path / "src" / "cli" / "main.py"
+    cli_main.write_text("# v1")
+    runs = []
+
+    def fake_run_command(argv, description):
+        runs.append(argv)
+        results.write_text('{"results": [], "summary": {}}')
+        return 0
+
+    monkeypatch.setattr(test_suite, "run_command", fake_run_command)
+    argv = ["generate", "--example"]
+
+    test_suite.run_generation(argv)
+    test_suite.run_generation(argv)
+    assert len(runs) == 1
+
+    cli_main.write_text("# v2")
+    test_suite.run_generation(argv)
+    assert len(runs) == 2
+
+    results.write_text('{"results": [{}], "summary": {}}')  # Rewritten outside the suite
+    test_suite.run_generation(argv)
+    assert len(runs) == 3